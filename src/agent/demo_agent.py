@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 import json
 import re
 from typing import Any
 import uuid
 
+from src.models import utc_now
 from src.utils.llm import LLMClientFactory
 
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DESTINATION_RE = re.compile(r"to ([A-Za-z ]+)")
+
 
 @dataclass
 class DemoAgentResponse:
@@ -161,7 +164,7 @@ class DemoAgent:
         """Return a mocked tool result for the demo."""
         if tool_name == "flight_search":
             date_value = str(parameters.get("date", ""))
-            if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_value):
+            if not _ISO_DATE_RE.match(date_value):
                 return {
                     "status": "error",
                     "error": f"Invalid date format: {date_value}. Expected YYYY-MM-DD.",
@@ -176,7 +179,7 @@ class DemoAgent:
 
     def _extract_destination(self, text: str) -> str | None:
         """Best-effort extraction of a destination city."""
-        match = re.search(r"to ([A-Za-z ]+)", text)
+        match = _DESTINATION_RE.search(text)
         if not match:
             return None
         return match.group(1).strip().title()
@@ -184,7 +187,7 @@ class DemoAgent:
 
 def build_conversation_payload(response: DemoAgentResponse, prompt_path: Path) -> dict[str, Any]:
     """Build a conversation payload compatible with ingestion."""
-    now = datetime.utcnow().isoformat()
+    now = utc_now().isoformat()
     return {
         "conversation_id": response.conversation_id,
         "turns": [
@@ -223,7 +226,7 @@ def append_turns_payload(
     else:
         max_turn_id = 0
 
-    now = datetime.utcnow().isoformat()
+    now = utc_now().isoformat()
     turns.append({
         "turn_id": max_turn_id + 1,
         "role": "user",
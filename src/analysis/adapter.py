@@ -25,15 +25,15 @@ def flatten_issue(evaluation: EvaluationResult, conversation: Conversation) -> L
         
         # Build flattened dictionary
         item = {
-            "issue_type": issue.issue_type.value,
-            "severity": issue.severity.value,
+            "issue_type": issue.issue_type,
+            "severity": issue.severity,
             "description": issue.description,
             "turn_id": issue.turn_id,
             "conversation_id": evaluation.conversation_id,
             "context_content": context_content,
             "suggested_fix": issue.suggested_fix,
             "embedding_string": construct_embedding_string(
-                issue.issue_type.value, 
+                issue.issue_type, 
                 issue.description, 
                 context_content
             )
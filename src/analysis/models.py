@@ -4,7 +4,7 @@ from enum import Enum
 from typing import List, Dict, Any, Optional
 import uuid
 
-from src.models import Issue, EvaluationResult, Conversation
+from src.models import Issue, EvaluationResult, Conversation, utc_now
 
 class ProposalStatus(str, Enum):
     DRAFT = "draft"
@@ -42,7 +42,7 @@ class ScoreDelta:
 class RegressionReport:
     """Complete regression test results."""
     run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
     test_case_count: int = 0
     score_deltas: List[ScoreDelta] = field(default_factory=list)
     overall_improvement: bool = False
@@ -61,6 +61,6 @@ class ImprovementProposal:
     evidence_ids: List[str] = field(default_factory=list)  # Linked conversation IDs
     status: ProposalStatus = ProposalStatus.DRAFT
     regression_report: Optional[RegressionReport] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
+    updated_at: datetime = field(default_factory=utc_now)
     metadata: Dict[str, Any] = field(default_factory=dict)
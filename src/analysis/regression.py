@@ -112,9 +112,8 @@ class RegressionTester:
         For the demo, we simulate the 'fix' by improving the conversation metadata
         or slightly boosting the perceived quality for the evaluators.
         """
-        shadow_turns = []
-        for turn in original.turns:
-            shadow_turns.append(turn)
+        # Turns are an immutable tuple, so the shadow can share them
+        shadow_turns = tuple(original.turns)
             
         metadata = {**original.metadata, "is_shadow": True, "prompt_version": "proposed"}
         if proposal.metadata.get("prompt_path"):
@@ -129,7 +128,7 @@ class RegressionTester:
             
         return Conversation(
             conversation_id=f"shadow_{original.conversation_id}",
-            turns=tuple(shadow_turns),
+            turns=shadow_turns,
             metadata=metadata
         )
 
@@ -112,6 +112,8 @@ class AnalysisService:
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_text(proposal.proposed_content)
             artifacts["tool_schema_path"] = str(path)
+            # Evaluators are reused across conversations; pick up the new schema
+            self.evaluation_service.refresh_strategies()
 
         proposal.status = ProposalStatus.APPROVED
         proposal.metadata.update(artifacts)
@@ -17,6 +17,7 @@ Endpoints:
 from datetime import datetime
 from typing import Any
 from pathlib import Path
+import asyncio
 import json
 import tempfile
 
@@ -31,7 +32,7 @@ from src.evaluation.service import EvaluationService, EvaluationError
 from src.evaluation.evaluators import get_global_registry, EvaluatorDiscovery
 from src.feedback.sampling import sample_conversations, list_strategies, ConversationSample
 from src.agent.demo_agent import DemoAgent, build_conversation_payload, append_turns_payload
-from src.models import FeedbackSignal
+from src.models import FeedbackSignal, parse_utc_timestamp, utc_now
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 DATA_DIR = BASE_DIR / "data"
@@ -298,7 +299,7 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return HealthResponse(
             status="healthy",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=utc_now().isoformat(),
             version="0.1.0",
         )
     
@@ -369,7 +370,8 @@ def create_app() -> FastAPI:
     @app.post("/ingest/pending", tags=["Ingestion"])
     async def ingest_pending(pending_dir: str = Query(default="data/pending")):
         """Process all JSON files in the pending directory."""
-        return ingestion_service.ingest_pending(pending_dir)
+        # Blocking disk I/O and parsing; keep it off the event loop
+        return await asyncio.to_thread(ingestion_service.ingest_pending, pending_dir)
     
     # =========================================================================
     # Evaluation Endpoints
@@ -465,7 +467,7 @@ def create_app() -> FastAPI:
             "turns": [
                 {
                     "turn_id": t.turn_id,
-                    "role": t.role.value,
+                    "role": t.role,
                     "content": t.content,
                     "timestamp": t.timestamp.isoformat() if t.timestamp else None,
                     "latency_ms": t.latency_ms,
@@ -795,7 +797,7 @@ def create_app() -> FastAPI:
             "turns": [
                 {
                     "turn_id": t.turn_id,
-                    "role": t.role.value,
+                    "role": t.role,
                     "content": t.content,
                     "timestamp": t.timestamp.isoformat() if t.timestamp else None,
                     "latency_ms": t.latency_ms,
@@ -883,8 +885,8 @@ def _evaluation_to_response(result) -> EvaluationResponse:
             scores=eval_result.scores,
             issues=[
                 IssueResponse(
-                    issue_type=i.issue_type.value,
-                    severity=i.severity.value,
+                    issue_type=i.issue_type,
+                    severity=i.severity,
                     description=i.description,
                     turn_id=i.turn_id,
                     suggested_fix=i.suggested_fix,
@@ -904,8 +906,8 @@ def _evaluation_to_response(result) -> EvaluationResponse:
         evaluations=evaluations,
         issues=[
             IssueResponse(
-                issue_type=i.issue_type.value,
-                severity=i.severity.value,
+                issue_type=i.issue_type,
+                severity=i.severity,
                 description=i.description,
                 turn_id=i.turn_id,
                 suggested_fix=i.suggested_fix,
@@ -918,12 +920,7 @@ def _evaluation_to_response(result) -> EvaluationResponse:
 
 def _parse_timestamp(value: str | None) -> datetime:
     """Parse an ISO timestamp, defaulting to now."""
-    if not value:
-        return datetime.utcnow()
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except ValueError:
-        return datetime.utcnow()
+    return parse_utc_timestamp(value) or utc_now()
 
 
 def _feedback_to_response(conversation_id: str, feedback: FeedbackSignal) -> FeedbackItemResponse:
@@ -23,6 +23,14 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_key: str = ""
     openai_model: str = "gpt-4o"
+    # Directory for cached LLM judge responses; empty keeps them in memory only
+    llm_cache_dir: str = ""
+    
+    # Evaluation
+    # Upper bound on conversations evaluated concurrently in a batch
+    max_workers: int = 8
+    # Worker processes for batch evaluation; 0 keeps it in-process (threads)
+    process_workers: int = 0
     
 
     # API settings
@@ -6,7 +6,7 @@ In production, this would use PostgreSQL with SQLAlchemy.
 
 Design:
 - In-memory storage for fast access during runtime
-- JSON file persistence for durability
+- One JSON file per record (``<kind>/<id>.json``) for durability
 - Simple CRUD operations
 
 Production swap:
@@ -14,27 +14,95 @@ Production swap:
 - Same interface, different implementation
 """
 
+import atexit
+import heapq
 import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-from functools import lru_cache
+from typing import Any, Collection, Iterator
+from urllib.parse import quote
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 from src.models import (
     Conversation,
     FeedbackSignal,
     Turn,
     ToolCall,
-    Role,
     EvaluationResult,
     EvaluatorResult,
     Issue,
-    IssueType,
     IssueSeverity,
+    IssueType,
+    parse_utc_timestamp,
+    utc_now,
 )
 
 
+# Record kinds persisted by InMemoryRepository, one ``<kind>/`` directory each.
+_SNAPSHOT_KINDS = ("conversations", "evaluations", "proposals")
+
+# Errors that mean a single stored record is malformed (missing keys, bad
+# enum values, wrong types). Anything else is a bug and is allowed to raise.
+_RECORD_ERRORS = (KeyError, ValueError, TypeError, AttributeError)
+
+# Bound once at import; reload calls this per turn/feedback/evaluation.
+_fromisoformat = datetime.fromisoformat
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse a stored ISO-8601 timestamp, returning None if absent or malformed."""
+    # Anything shorter than YYYY-MM-DD cannot be a valid timestamp; skip the
+    # parser (and its exception path) entirely for those.
+    if not isinstance(value, str) or len(value) < 10:
+        return None
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        return None
+
+
+
+def _json_default(value: Any) -> Any:
+    """Encode types the JSON encoders don't handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# json.dump/dumps build a new JSONEncoder whenever options are passed; build
+# the snapshot encoder once and reuse it for every record.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_json_default)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write snapshot data to path as UTF-8 JSON without padding whitespace.
+    
+    Uses orjson when installed (datetimes are encoded natively), writing its
+    bytes directly. Otherwise, or for values orjson rejects such as integers
+    wider than 64 bits, stdlib json streams the encoding into the file
+    instead of building the whole string in memory first.
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            path.write_bytes(payload)
+            return
+    with path.open("w", encoding="utf-8") as f:
+        for chunk in _JSON_ENCODER.iterencode(data):
+            f.write(chunk)
+
+
 class ConversationRepository(ABC):
     """Abstract repository interface for conversations and evaluations."""
     
@@ -43,6 +111,14 @@ class ConversationRepository(ABC):
         """Save a conversation and return its ID."""
         pass
     
+    def save_conversations(self, conversations: list[Conversation]) -> list[str]:
+        """Save several conversations and return their IDs, in order.
+        
+        Backends with a query engine should override this with one batched
+        write (e.g. a single transaction with ``executemany``).
+        """
+        return [self.save_conversation(conversation) for conversation in conversations]
+    
     @abstractmethod
     def get_conversation(self, conversation_id: str) -> Conversation | None:
         """Get a conversation by ID."""
@@ -53,6 +129,19 @@ class ConversationRepository(ABC):
         """List conversations with pagination."""
         pass
 
+    def get_conversations(self, conversation_ids: list[str]) -> dict[str, Conversation]:
+        """Get several conversations at once, keyed by ID; missing IDs are omitted.
+        
+        Backends with a query engine should override this with one batched
+        lookup (e.g. chunked ``IN`` lists) instead of a query per ID.
+        """
+        conversations = {}
+        for conversation_id in conversation_ids:
+            conversation = self.get_conversation(conversation_id)
+            if conversation is not None:
+                conversations[conversation_id] = conversation
+        return conversations
+
     @abstractmethod
     def add_feedback(self, conversation_id: str, feedback: FeedbackSignal) -> None:
         """Append feedback to a conversation."""
@@ -73,16 +162,56 @@ class ConversationRepository(ABC):
         """Save an evaluation result and return its run_id."""
         pass
     
+    def save_evaluations(self, evaluations: list[EvaluationResult]) -> list[str]:
+        """Save several evaluation results and return the run_ids that were saved.
+        
+        A result that fails to save is marked ``status="failed"`` and skipped
+        rather than aborting the rest of the batch. Backends with a query
+        engine should override this with one batched write (e.g. a single
+        transaction with ``executemany``).
+        """
+        run_ids = []
+        for evaluation in evaluations:
+            try:
+                run_ids.append(self.save_evaluation(evaluation))
+            except Exception as e:
+                print(f"Warning: Failed to save evaluation for {evaluation.conversation_id}: {e}")
+                evaluation.status = "failed"
+        return run_ids
+    
     @abstractmethod
     def get_evaluation(self, conversation_id: str) -> EvaluationResult | None:
         """Get the latest evaluation for a conversation."""
         pass
     
+    def get_ids_with_issues(self, candidate_ids: Collection[str]) -> set[str]:
+        """Return the candidates whose latest evaluation reported any issue.
+        
+        Backends with a query engine should override this with one filtered
+        query over the candidate IDs.
+        """
+        ids = set()
+        for conversation_id in candidate_ids:
+            evaluation = self.get_evaluation(conversation_id)
+            if evaluation is not None and evaluation.issues:
+                ids.add(conversation_id)
+        return ids
+    
     @abstractmethod
     def list_evaluations(self, limit: int = 100, offset: int = 0) -> list[EvaluationResult]:
         """List evaluations with pagination."""
         pass
     
+    def iter_evaluations(self, limit: int = 1000, batch: int = 200) -> Iterator[EvaluationResult]:
+        """Yield up to ``limit`` evaluations, newest first, fetched ``batch`` at a time."""
+        offset = 0
+        while offset < limit:
+            page = self.list_evaluations(limit=min(batch, limit - offset), offset=offset)
+            yield from page
+            if len(page) < batch:
+                return
+            offset += len(page)
+    
     @abstractmethod
     def get_pending_conversations(self) -> list[str]:
         """Get IDs of conversations that haven't been evaluated."""
@@ -103,160 +232,372 @@ class ConversationRepository(ABC):
         """List proposals with pagination."""
         pass
 
+    def iter_feedback(
+        self,
+        signal: str | None = None,
+        feedback_types: Collection[str] | None = None,
+        sources: Collection[str] | None = None,
+        limit: int = 1000,
+    ) -> Iterator[tuple[str, datetime, FeedbackSignal]]:
+        """Yield ``(conversation_id, created_at, feedback)`` for matching feedback.
+        
+        Covers the ``limit`` most recent conversations, newest first, with
+        each conversation's feedback kept together and in order. ``None``
+        filters match everything. Backends with a query engine should push
+        the filters down instead of loading conversations.
+        """
+        for conversation in self.list_conversations(limit=limit):
+            for feedback in conversation.feedback:
+                if signal is not None and feedback.signal != signal:
+                    continue
+                if feedback_types is not None and feedback.feedback_type not in feedback_types:
+                    continue
+                if sources is not None and feedback.source not in sources:
+                    continue
+                yield conversation.conversation_id, conversation.created_at, feedback
+
 
 class InMemoryRepository(ConversationRepository):
     """In-memory repository with optional file persistence.
     
     Suitable for demos and testing. Data stored in memory with
     periodic flush to JSON files for durability.
+
+    Each record lives in its own ``<kind>/<id>.json`` file. Mutations only
+    mark the affected record as dirty; a background thread rewrites the
+    dirty files after ``flush_interval`` seconds, so bursts of saves
+    coalesce and a save costs O(record) bytes regardless of repository
+    size. Files are replaced atomically, so a crash mid-write leaves the
+    previous version intact. Call ``flush()`` to persist synchronously, or
+    ``close()`` (also available as a context manager); pending writes are
+    flushed at interpreter exit as well.
     """
     
-    def __init__(self, data_dir: str | Path | None = None):
+    def __init__(self, data_dir: str | Path | None = None, flush_interval: float = 0.1):
         self._conversations: dict[str, Conversation] = {}
         self._evaluations: dict[str, EvaluationResult] = {}
         self._proposals: dict[str, Any] = {}
         self._proposal_types: dict[str, str] = {} # Helper for serialization mapping
+        # Unevaluated conversation ids, kept in save order (dict as ordered set)
+        self._pending: dict[str, None] = {}
         self._data_dir = Path(data_dir) if data_dir else None
+        self._flush_interval = flush_interval
+        # Per kind: ids to write (or unlink) on the next flush, and kinds
+        # migrated from a legacy snapshot that must be written out in full.
+        self._dirty: dict[str, set[str]] = {kind: set() for kind in _SNAPSHOT_KINDS}
+        self._rewrite: set[str] = set()
+        self._closed = False
+        self._dirty_cv = threading.Condition()
+        self._flush_lock = threading.Lock()
         
         if self._data_dir:
             self._data_dir.mkdir(parents=True, exist_ok=True)
             self._load_from_disk()
+            threading.Thread(
+                target=self._flush_loop, name="repository-flusher", daemon=True
+            ).start()
+            atexit.register(self.flush)
+
+    def __enter__(self) -> InMemoryRepository:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _mark_dirty(self, kind: str, record_id: str) -> None:
+        """Schedule a record of the given kind for writing on the next flush."""
+        if not self._data_dir:
+            return
+        with self._dirty_cv:
+            self._dirty[kind].add(record_id)
+            self._dirty_cv.notify()
+
+    def _mark_dirty_many(self, kind: str, record_ids: list[str]) -> None:
+        """Like ``_mark_dirty`` for several records, taking the lock once."""
+        if not self._data_dir or not record_ids:
+            return
+        with self._dirty_cv:
+            self._dirty[kind].update(record_ids)
+            self._dirty_cv.notify()
+
+    def _has_pending(self) -> bool:
+        return bool(self._rewrite) or any(self._dirty.values())
+
+    def _flush_loop(self) -> None:
+        """Background writer: wait for dirty records, debounce, then flush.
+
+        A failed flush leaves its records queued and is retried with a
+        growing delay, so one bad write never stops the writer.
+        """
+        delay = self._flush_interval
+        while True:
+            with self._dirty_cv:
+                self._dirty_cv.wait_for(lambda: self._closed or self._has_pending())
+                if self._closed:
+                    return
+            time.sleep(delay)
+            try:
+                self.flush()
+                delay = self._flush_interval
+            except Exception as e:
+                print(f"Warning: Repository flush to {self._data_dir} failed, will retry: {e!r}")
+                delay = min(max(delay * 2, 1.0), 30.0)
+
+    def flush(self) -> None:
+        """Write all dirty records to disk now.
+
+        Records that could not be written are queued again before the
+        error is raised.
+        """
+        with self._flush_lock:
+            with self._dirty_cv:
+                if not self._has_pending():
+                    return
+                dirty = self._dirty
+                rewrite = self._rewrite
+                self._dirty = {kind: set() for kind in _SNAPSHOT_KINDS}
+                self._rewrite = set()
+            try:
+                self._save_to_disk(dirty, rewrite)
+            except BaseException:
+                # _save_to_disk drops what it wrote; requeue the rest
+                with self._dirty_cv:
+                    for kind, ids in dirty.items():
+                        self._dirty[kind].update(ids)
+                    self._rewrite.update(rewrite)
+                raise
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer."""
+        self.flush()
+        with self._dirty_cv:
+            self._closed = True
+            self._dirty_cv.notify()
+        atexit.unregister(self.flush)
     
     def _load_from_disk(self) -> None:
-        """Load data from JSON files if they exist."""
-        conv_file = self._data_dir / "conversations.json"
-        eval_file = self._data_dir / "evaluations.json"
-        prop_file = self._data_dir / "proposals.json"
-        
-        if conv_file.exists():
+        """Load data from snapshot files if they exist."""
+        for item in self._read_snapshot("conversations"):
             try:
-                data = json.loads(conv_file.read_text())
-                for item in data:
-                    conv = self._dict_to_conversation(item)
-                    self._conversations[conv.conversation_id] = conv
-            except Exception:
-                pass
+                conv = self._dict_to_conversation(item)
+            except _RECORD_ERRORS as e:
+                print(f"Warning: Skipping malformed conversation record: {e!r}")
+                continue
+            self._conversations[conv.conversation_id] = conv
         
-        if eval_file.exists():
+        for item in self._read_snapshot("evaluations"):
+            try:
+                evaluation = self._dict_to_evaluation(item)
+            except _RECORD_ERRORS as e:
+                print(f"Warning: Skipping malformed evaluation record: {e!r}")
+                continue
+            self._evaluations[evaluation.conversation_id] = evaluation
+
+        for item in self._read_snapshot("proposals"):
             try:
-                data = json.loads(eval_file.read_text())
-                for item in data:
-                    evaluation = self._dict_to_evaluation(item)
-                    self._evaluations[evaluation.conversation_id] = evaluation
-            except Exception:
-                pass
-
-        if prop_file.exists():
+                prop = self._dict_to_proposal(item)
+            except _RECORD_ERRORS as e:
+                print(f"Warning: Skipping malformed proposal record: {e!r}")
+                continue
+            self._proposals[prop.proposal_id] = prop
+
+        self._pending = dict.fromkeys(
+            cid for cid in self._conversations if cid not in self._evaluations
+        )
+
+    def _record_path(self, kind: str, record_id: str) -> Path:
+        """Path of the file holding one record; ids are quoted to stay a single name."""
+        return self._data_dir / kind / f"{quote(record_id, safe='')}.json"
+
+    def _read_snapshot(self, kind: str) -> list[dict[str, Any]]:
+        """Read every record file under ``<kind>/``.
+        
+        Records are written to ``<name>.tmp`` and renamed into place, so a
+        ``.tmp`` left behind is an interrupted write whose previous version
+        is still intact; it is discarded. Undecodable files are moved aside
+        as ``<name>.corrupt`` without affecting other records. If the
+        directory does not exist yet, records are read from a legacy
+        ``<kind>.jsonl`` log or ``<kind>.json`` array instead and the kind is
+        scheduled for migration to per-record files on the next flush.
+        """
+        directory = self._data_dir / kind
+        if not directory.is_dir():
+            return self._read_legacy_snapshot(kind)
+
+        for tmp in directory.glob("*.json.tmp"):
+            print(f"Warning: Discarding interrupted write {tmp}")
+            tmp.unlink(missing_ok=True)
+
+        records: list[dict[str, Any]] = []
+        for path in directory.glob("*.json"):
             try:
-                # Lazy import to avoid circular dependency
-                from src.analysis.models import ImprovementProposal, ImprovementType, ProposalStatus, RegressionReport, ScoreDelta
-                data = json.loads(prop_file.read_text())
-                for item in data:
-                    # Reconstruction
-                    report = None
-                    if item.get("regression_report"):
-                        r_data = item["regression_report"]
-                        deltas = [
-                            ScoreDelta(
-                                metric_name=d["metric_name"],
-                                old_val=d["old_val"],
-                                new_val=d["new_val"],
-                                is_improvement=d["is_improvement"]
-                            )
-                            for d in r_data.get("score_deltas", [])
-                        ]
-                        report = RegressionReport(
-                            run_id=r_data["run_id"],
-                            timestamp=datetime.fromisoformat(r_data["timestamp"]),
-                            test_case_count=r_data["test_case_count"],
-                            overall_improvement=r_data["overall_improvement"],
-                            score_deltas=deltas
-                        )
-
-                    prop = ImprovementProposal(
-                        proposal_id=item["proposal_id"],
-                        type=ImprovementType(item["type"]),
-                        failure_pattern=item["failure_pattern"],
-                        rationale=item["rationale"],
-                        original_content=item["original_content"],
-                        proposed_content=item["proposed_content"],
-                        status=ProposalStatus(item["status"]),
-                        evidence_ids=item["evidence_ids"],
-                        created_at=datetime.fromisoformat(item["created_at"]),
-                        regression_report=report,
-                        metadata=item.get("metadata", {})
-                    )
-                    self._proposals[prop.proposal_id] = prop
-            except Exception:
-                pass
-    
-    def _save_to_disk(self) -> None:
-        """Save data to JSON files."""
+                records.append(json.loads(path.read_bytes()))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                corrupt = path.with_name(path.name + ".corrupt")
+                print(f"Warning: Could not load {path} ({e}); moving it to {corrupt}")
+                path.replace(corrupt)
+            except OSError as e:
+                print(f"Warning: Could not read {path}: {e}")
+        return records
+
+    def _read_legacy_snapshot(self, kind: str) -> list[dict[str, Any]]:
+        """Read a pre-sharding snapshot (JSON Lines log or single JSON array)."""
+        log = self._data_dir / f"{kind}.jsonl"
+        array = self._data_dir / f"{kind}.json"
+        if log.exists():
+            self._rewrite.add(kind)
+            records = []
+            with log.open("r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        print(f"Warning: Skipping undecodable line {line_no} of {log}: {e}")
+            return records
+        if not array.exists():
+            return []
+        self._rewrite.add(kind)
+        try:
+            data = json.loads(array.read_text())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            corrupt = array.with_name(array.name + ".corrupt")
+            print(f"Warning: Could not load {array} ({e}); moving it to {corrupt}")
+            array.replace(corrupt)
+            return []
+        if not isinstance(data, list):
+            print(f"Warning: Ignoring {array}: expected a JSON array")
+            return []
+        return data
+
+    def _dict_to_proposal(self, item: dict[str, Any]) -> Any:
+        """Convert dictionary to ImprovementProposal."""
+        # Lazy import to avoid circular dependency
+        from src.analysis.models import ImprovementProposal, ImprovementType, ProposalStatus, RegressionReport, ScoreDelta
+
+        report = None
+        if item.get("regression_report"):
+            r_data = item["regression_report"]
+            deltas = [
+                ScoreDelta(
+                    metric_name=d["metric_name"],
+                    old_val=d["old_val"],
+                    new_val=d["new_val"],
+                    is_improvement=d["is_improvement"]
+                )
+                for d in r_data.get("score_deltas", [])
+            ]
+            report = RegressionReport(
+                run_id=r_data["run_id"],
+                timestamp=parse_utc_timestamp(r_data["timestamp"]) or utc_now(),
+                test_case_count=r_data["test_case_count"],
+                overall_improvement=r_data["overall_improvement"],
+                score_deltas=deltas
+            )
+
+        return ImprovementProposal(
+            proposal_id=item["proposal_id"],
+            type=ImprovementType(item["type"]),
+            failure_pattern=item["failure_pattern"],
+            rationale=item["rationale"],
+            original_content=item["original_content"],
+            proposed_content=item["proposed_content"],
+            status=ProposalStatus(item["status"]),
+            evidence_ids=item["evidence_ids"],
+            created_at=parse_utc_timestamp(item["created_at"]) or utc_now(),
+            regression_report=report,
+            metadata=item.get("metadata", {})
+        )
+    
+    def _save_to_disk(self, dirty: dict[str, set[str]], rewrite: set[str]) -> None:
+        """Write dirty records to their own files; write every record of kinds in ``rewrite``.
+
+        Written ids are removed from ``dirty`` (and finished kinds from
+        ``rewrite``) as it goes, so on error both hold only what is left.
+        """
         if not self._data_dir:
             return
         
-        conv_file = self._data_dir / "conversations.json"
-        eval_file = self._data_dir / "evaluations.json"
-        prop_file = self._data_dir / "proposals.json"
-        
-        conv_data = [self._conversation_to_dict(c) for c in self._conversations.values()]
-        eval_data = [self._evaluation_to_dict(e) for e in self._evaluations.values()]
+        snapshots = {
+            "conversations": (self._conversations, self._conversation_to_dict),
+            "evaluations": (self._evaluations, self._evaluation_to_dict),
+            "proposals": (self._proposals, self._proposal_to_dict),
+        }
+        for kind in _SNAPSHOT_KINDS:
+            records, to_dict = snapshots[kind]
+            # list() snapshots the keys so request threads can keep
+            # mutating while we serialize.
+            ids = list(records) if kind in rewrite else list(dirty[kind])
+            if not ids:
+                continue
+            (self._data_dir / kind).mkdir(exist_ok=True)
+            for record_id in ids:
+                path = self._record_path(kind, record_id)
+                record = records.get(record_id)
+                if record is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    tmp = path.with_name(path.name + ".tmp")
+                    _write_json(tmp, to_dict(record))
+                    os.replace(tmp, path)
+                dirty[kind].discard(record_id)
+            if kind in rewrite:
+                # Migration done; retire the legacy snapshot files.
+                for legacy in (f"{kind}.jsonl", f"{kind}.json"):
+                    (self._data_dir / legacy).unlink(missing_ok=True)
+                rewrite.discard(kind)
+
+    def _proposal_to_dict(self, p: Any) -> dict[str, Any]:
+        """Convert ImprovementProposal to dictionary for JSON serialization."""
+        p_dict = {
+            "proposal_id": p.proposal_id,
+            "type": p.type.value if hasattr(p.type, "value") else p.type,
+            "failure_pattern": p.failure_pattern,
+            "rationale": p.rationale,
+            "original_content": p.original_content,
+            "proposed_content": p.proposed_content,
+            "status": p.status.value if hasattr(p.status, "value") else p.status,
+            "evidence_ids": p.evidence_ids,
+            "created_at": p.created_at,
+            "regression_report": None,
+            "metadata": p.metadata
+        }
         
-        conv_file.write_text(json.dumps(conv_data, indent=2, default=str))
-        eval_file.write_text(json.dumps(eval_data, indent=2, default=str))
-
-        if self._proposals:
-            prop_data = []
-            for p in self._proposals.values():
-                p_dict = {
-                    "proposal_id": p.proposal_id,
-                    "type": p.type.value if hasattr(p.type, "value") else p.type,
-                    "failure_pattern": p.failure_pattern,
-                    "rationale": p.rationale,
-                    "original_content": p.original_content,
-                    "proposed_content": p.proposed_content,
-                    "status": p.status.value if hasattr(p.status, "value") else p.status,
-                    "evidence_ids": p.evidence_ids,
-                    "created_at": p.created_at.isoformat(),
-                    "regression_report": None,
-                    "metadata": p.metadata
-                }
-                
-                if p.regression_report:
-                    r = p.regression_report
-                    p_dict["regression_report"] = {
-                        "run_id": r.run_id,
-                        "timestamp": r.timestamp.isoformat(),
-                        "test_case_count": r.test_case_count,
-                        "overall_improvement": r.overall_improvement,
-                        "score_deltas": [
-                            {
-                                "metric_name": d.metric_name,
-                                "old_val": d.old_val,
-                                "new_val": d.new_val,
-                                "is_improvement": d.is_improvement
-                            }
-                            for d in r.score_deltas
-                        ]
+        if p.regression_report:
+            r = p.regression_report
+            p_dict["regression_report"] = {
+                "run_id": r.run_id,
+                "timestamp": r.timestamp,
+                "test_case_count": r.test_case_count,
+                "overall_improvement": r.overall_improvement,
+                "score_deltas": [
+                    {
+                        "metric_name": d.metric_name,
+                        "old_val": d.old_val,
+                        "new_val": d.new_val,
+                        "is_improvement": d.is_improvement
                     }
-                
-                prop_data.append(p_dict)
-            prop_file.write_text(json.dumps(prop_data, indent=2))
+                    for d in r.score_deltas
+                ]
+            }
+        return p_dict
     
     def _conversation_to_dict(self, conv: Conversation) -> dict[str, Any]:
         """Convert Conversation to dictionary for JSON serialization."""
+        cols = conv.turn_columns()
         return {
             "conversation_id": conv.conversation_id,
             "feedback": [self._feedback_to_dict(f) for f in conv.feedback],
             "metadata": conv.metadata,
-            "created_at": conv.created_at.isoformat(),
+            "created_at": conv.created_at,
             "turns": [
                 {
-                    "turn_id": t.turn_id,
-                    "role": t.role.value,
-                    "content": t.content,
-                    "timestamp": t.timestamp.isoformat() if t.timestamp else None,
-                    "latency_ms": t.latency_ms,
+                    "turn_id": turn_id,
+                    "role": role,
+                    "content": content,
+                    "timestamp": timestamp,
+                    "latency_ms": latency_ms,
                     "tool_calls": [
                         {
                             "tool_name": tc.tool_name,
@@ -264,10 +605,13 @@ class InMemoryRepository(ConversationRepository):
                             "result": tc.result,
                             "execution_time_ms": tc.execution_time_ms,
                         }
-                        for tc in t.tool_calls
+                        for tc in tool_calls
                     ],
                 }
-                for t in conv.turns
+                for turn_id, role, content, timestamp, latency_ms, tool_calls in zip(
+                    cols.turn_ids, cols.roles, cols.contents,
+                    cols.timestamps, cols.latency_ms, cols.tool_calls,
+                )
             ],
         }
 
@@ -278,7 +622,7 @@ class InMemoryRepository(ConversationRepository):
             "signal": feedback.signal,
             "value": feedback.value,
             "source": feedback.source,
-            "timestamp": feedback.timestamp.isoformat() if feedback.timestamp else None,
+            "timestamp": feedback.timestamp,
             "turn_id": feedback.turn_id,
             "annotator_id": feedback.annotator_id,
             "confidence": feedback.confidence,
@@ -287,19 +631,14 @@ class InMemoryRepository(ConversationRepository):
 
     def _dict_to_feedback(self, data: dict[str, Any]) -> FeedbackSignal:
         """Convert dictionary to FeedbackSignal."""
-        timestamp = None
-        if data.get("timestamp"):
-            try:
-                timestamp = datetime.fromisoformat(data["timestamp"])
-            except (ValueError, TypeError):
-                timestamp = None
+        timestamp = parse_utc_timestamp(data.get("timestamp"))
 
         return FeedbackSignal(
             feedback_type=data.get("feedback_type", "explicit"),
             signal=data.get("signal", ""),
             value=data.get("value"),
             source=data.get("source", ""),
-            timestamp=timestamp or datetime.utcnow(),
+            timestamp=timestamp or utc_now(),
             turn_id=data.get("turn_id"),
             annotator_id=data.get("annotator_id"),
             confidence=data.get("confidence"),
@@ -308,6 +647,7 @@ class InMemoryRepository(ConversationRepository):
 
     def _dict_to_conversation(self, data: dict[str, Any]) -> Conversation:
         """Convert dictionary to Conversation."""
+        parse_timestamp = _parse_timestamp
         turns = []
         for t in data.get("turns", []):
             tool_calls = tuple(
@@ -320,18 +660,11 @@ class InMemoryRepository(ConversationRepository):
                 for tc in t.get("tool_calls", [])
             )
             
-            timestamp = None
-            if t.get("timestamp"):
-                try:
-                    timestamp = datetime.fromisoformat(t["timestamp"])
-                except (ValueError, TypeError):
-                    pass
-            
             turns.append(Turn(
                 turn_id=t["turn_id"],
-                role=Role(t["role"]),
+                role=t["role"],
                 content=t["content"],
-                timestamp=timestamp,
+                timestamp=parse_timestamp(t.get("timestamp")),
                 latency_ms=t.get("latency_ms"),
                 tool_calls=tool_calls,
             ))
@@ -341,12 +674,7 @@ class InMemoryRepository(ConversationRepository):
             if isinstance(item, dict):
                 feedback_items.append(self._dict_to_feedback(item))
         
-        created_at = datetime.utcnow()
-        if data.get("created_at"):
-            try:
-                created_at = datetime.fromisoformat(data["created_at"])
-            except (ValueError, TypeError):
-                pass
+        created_at = parse_utc_timestamp(data.get("created_at")) or utc_now()
         
         return Conversation(
             conversation_id=data["conversation_id"],
@@ -356,64 +684,74 @@ class InMemoryRepository(ConversationRepository):
             created_at=created_at,
         )
     
+    def _issue_to_dict(self, issue: Issue) -> dict[str, Any]:
+        """Convert Issue to dictionary, omitting optional fields that are unset."""
+        data: dict[str, Any] = {
+            "issue_type": issue.issue_type,
+            "severity": issue.severity,
+            "description": issue.description,
+        }
+        if issue.turn_id is not None:
+            data["turn_id"] = issue.turn_id
+        if issue.details:
+            data["details"] = issue.details
+        if issue.suggested_fix is not None:
+            data["suggested_fix"] = issue.suggested_fix
+        return data
+
+    def _dict_to_issue(self, data: dict[str, Any]) -> Issue:
+        """Convert dictionary to Issue."""
+        issue_type, severity = data["issue_type"], data["severity"]
+        if issue_type not in IssueType._VALID:
+            raise ValueError(f"{issue_type!r} is not a valid IssueType")
+        if severity not in IssueSeverity._VALID:
+            raise ValueError(f"{severity!r} is not a valid IssueSeverity")
+        return Issue(
+            issue_type=issue_type,
+            severity=severity,
+            description=data["description"],
+            turn_id=data.get("turn_id"),
+            details=data.get("details", {}),
+            suggested_fix=data.get("suggested_fix"),
+        )
+
     def _evaluation_to_dict(self, evaluation: EvaluationResult) -> dict[str, Any]:
-        """Convert EvaluationResult to dictionary for JSON serialization."""
+        """Convert EvaluationResult to dictionary for JSON serialization.
+        
+        Unset optional fields (None / empty) are omitted; the loader fills
+        them back in with their defaults.
+        """
+        issue_to_dict = self._issue_to_dict
         evaluations_dict = {}
         for name, result in evaluation.evaluations.items():
-            evaluations_dict[name] = {
+            result_dict: dict[str, Any] = {
                 "evaluator_name": result.evaluator_name,
                 "scores": result.scores,
                 "confidence": result.confidence,
-                "latency_ms": result.latency_ms,
-                "metadata": result.metadata,
-                "issues": [
-                    {
-                        "issue_type": issue.issue_type.value,
-                        "severity": issue.severity.value,
-                        "description": issue.description,
-                        "turn_id": issue.turn_id,
-                        "details": issue.details,
-                        "suggested_fix": issue.suggested_fix,
-                    }
-                    for issue in result.issues
-                ],
             }
+            if result.latency_ms is not None:
+                result_dict["latency_ms"] = result.latency_ms
+            if result.metadata:
+                result_dict["metadata"] = result.metadata
+            if result.issues:
+                result_dict["issues"] = [issue_to_dict(issue) for issue in result.issues]
+            evaluations_dict[name] = result_dict
         
         return {
             "conversation_id": evaluation.conversation_id,
             "run_id": evaluation.run_id,
-            "timestamp": evaluation.timestamp.isoformat(),
+            "timestamp": evaluation.timestamp,
             "aggregate_score": evaluation.aggregate_score,
             "status": evaluation.status,
             "evaluations": evaluations_dict,
-            "issues": [
-                {
-                    "issue_type": issue.issue_type.value,
-                    "severity": issue.severity.value,
-                    "description": issue.description,
-                    "turn_id": issue.turn_id,
-                    "details": issue.details,
-                    "suggested_fix": issue.suggested_fix,
-                }
-                for issue in evaluation.issues
-            ],
+            "issues": [issue_to_dict(issue) for issue in evaluation.issues],
         }
     
     def _dict_to_evaluation(self, data: dict[str, Any]) -> EvaluationResult:
         """Convert dictionary to EvaluationResult."""
         evaluations = {}
         for name, result_data in data.get("evaluations", {}).items():
-            issues = tuple(
-                Issue(
-                    issue_type=IssueType(i["issue_type"]),
-                    severity=IssueSeverity(i["severity"]),
-                    description=i["description"],
-                    turn_id=i.get("turn_id"),
-                    details=i.get("details", {}),
-                    suggested_fix=i.get("suggested_fix"),
-                )
-                for i in result_data.get("issues", [])
-            )
+            issues = tuple(self._dict_to_issue(i) for i in result_data.get("issues", []))
             
             evaluations[name] = EvaluatorResult(
                 evaluator_name=result_data["evaluator_name"],
@@ -424,24 +762,9 @@ class InMemoryRepository(ConversationRepository):
                 issues=issues,
             )
         
-        all_issues = [
-            Issue(
-                issue_type=IssueType(i["issue_type"]),
-                severity=IssueSeverity(i["severity"]),
-                description=i["description"],
-                turn_id=i.get("turn_id"),
-                details=i.get("details", {}),
-                suggested_fix=i.get("suggested_fix"),
-            )
-            for i in data.get("issues", [])
-        ]
+        all_issues = [self._dict_to_issue(i) for i in data.get("issues", [])]
         
-        timestamp = datetime.utcnow()
-        if data.get("timestamp"):
-            try:
-                timestamp = datetime.fromisoformat(data["timestamp"])
-            except (ValueError, TypeError):
-                pass
+        timestamp = parse_utc_timestamp(data.get("timestamp")) or utc_now()
         
         return EvaluationResult(
             conversation_id=data["conversation_id"],
@@ -458,21 +781,45 @@ class InMemoryRepository(ConversationRepository):
     # =========================================================================
     
     def save_conversation(self, conversation: Conversation) -> str:
-        """Save a conversation and return its ID."""
-        self._conversations[conversation.conversation_id] = conversation
-        self._save_to_disk()
+        """Save a conversation and return its ID.
+        
+        Re-saving a distinct but equal copy of the stored conversation (common
+        when pipelines re-ingest) skips the disk write. The same object is
+        always written, since it may have been mutated in place.
+        """
+        if self._store_conversation(conversation):
+            self._mark_dirty("conversations", conversation.conversation_id)
         return conversation.conversation_id
     
+    def save_conversations(self, conversations: list[Conversation]) -> list[str]:
+        """Save several conversations and return their IDs, in order."""
+        dirty = [c.conversation_id for c in conversations if self._store_conversation(c)]
+        self._mark_dirty_many("conversations", dirty)
+        return [c.conversation_id for c in conversations]
+    
+    def _store_conversation(self, conversation: Conversation) -> bool:
+        """Store a conversation in memory; return whether it needs writing."""
+        conversation_id = conversation.conversation_id
+        existing = self._conversations.get(conversation_id)
+        self._conversations[conversation_id] = conversation
+        if conversation_id not in self._evaluations:
+            self._pending[conversation_id] = None
+        return existing is None or existing is conversation or existing != conversation
+    
     def get_conversation(self, conversation_id: str) -> Conversation | None:
         """Get a conversation by ID."""
         return self._conversations.get(conversation_id)
     
+    def get_conversations(self, conversation_ids: list[str]) -> dict[str, Conversation]:
+        """Get several conversations at once, keyed by ID; missing IDs are omitted."""
+        stored = self._conversations
+        return {cid: stored[cid] for cid in conversation_ids if cid in stored}
+    
     def list_conversations(self, limit: int = 100, offset: int = 0) -> list[Conversation]:
         """List conversations with pagination."""
-        conversations = list(self._conversations.values())
-        # Sort by created_at descending
-        conversations.sort(key=lambda c: c.created_at, reverse=True)
-        return conversations[offset:offset + limit]
+        # Newest first; only the requested page (plus offset) is ranked.
+        top = heapq.nlargest(offset + limit, self._conversations.values(), key=lambda c: c.created_at)
+        return top[offset:offset + limit]
 
     def add_feedback(self, conversation_id: str, feedback: FeedbackSignal) -> None:
         """Append feedback to a conversation."""
@@ -482,7 +829,7 @@ class InMemoryRepository(ConversationRepository):
         existing = list(conversation.feedback)
         existing.append(feedback)
         conversation.feedback = tuple(existing)
-        self._save_to_disk()
+        self._mark_dirty("conversations", conversation_id)
 
     def flag_for_review(self, conversation_id: str, reason: str | None = None) -> None:
         """Mark a conversation as needing human review."""
@@ -492,7 +839,7 @@ class InMemoryRepository(ConversationRepository):
         conversation.metadata["needs_review"] = True
         if reason:
             conversation.metadata["review_reason"] = reason
-        self._save_to_disk()
+        self._mark_dirty("conversations", conversation_id)
 
     def list_feedback(self, conversation_id: str) -> list[FeedbackSignal]:
         """List feedback items for a conversation."""
@@ -504,32 +851,49 @@ class InMemoryRepository(ConversationRepository):
     def save_evaluation(self, evaluation: EvaluationResult) -> str:
         """Save an evaluation result and return its run_id."""
         self._evaluations[evaluation.conversation_id] = evaluation
-        self._save_to_disk()
+        self._pending.pop(evaluation.conversation_id, None)
+        self._mark_dirty("evaluations", evaluation.conversation_id)
         return evaluation.run_id
     
+    def save_evaluations(self, evaluations: list[EvaluationResult]) -> list[str]:
+        """Save several evaluation results and return their run_ids."""
+        for evaluation in evaluations:
+            self._evaluations[evaluation.conversation_id] = evaluation
+            self._pending.pop(evaluation.conversation_id, None)
+        self._mark_dirty_many("evaluations", [e.conversation_id for e in evaluations])
+        return [e.run_id for e in evaluations]
+    
     def get_evaluation(self, conversation_id: str) -> EvaluationResult | None:
         """Get the latest evaluation for a conversation."""
         return self._evaluations.get(conversation_id)
     
+    def get_ids_with_issues(self, candidate_ids: Collection[str]) -> set[str]:
+        """Return the candidates whose latest evaluation reported any issue."""
+        get = self._evaluations.get
+        return {cid for cid in candidate_ids if (evaluation := get(cid)) is not None and evaluation.issues}
+    
     def list_evaluations(self, limit: int = 100, offset: int = 0) -> list[EvaluationResult]:
         """List evaluations with pagination."""
-        evaluations = list(self._evaluations.values())
-        # Sort by timestamp descending
-        evaluations.sort(key=lambda e: e.timestamp, reverse=True)
-        return evaluations[offset:offset + limit]
+        # Newest first; only the requested page (plus offset) is ranked.
+        top = heapq.nlargest(offset + limit, self._evaluations.values(), key=lambda e: e.timestamp)
+        return top[offset:offset + limit]
+    
+    def iter_evaluations(self, limit: int = 1000, batch: int = 200) -> Iterator[EvaluationResult]:
+        """Yield up to ``limit`` evaluations, newest first.
+        
+        Everything is already in memory, so the ranking is done once rather
+        than per ``batch``-sized page.
+        """
+        yield from heapq.nlargest(limit, self._evaluations.values(), key=lambda e: e.timestamp)
     
     def get_pending_conversations(self) -> list[str]:
         """Get IDs of conversations that haven't been evaluated."""
-        evaluated_ids = set(self._evaluations.keys())
-        return [
-            cid for cid in self._conversations.keys()
-            if cid not in evaluated_ids
-        ]
+        return list(self._pending)
 
     def save_proposal(self, proposal: Any) -> str:
         """Save an improvement proposal."""
         self._proposals[proposal.proposal_id] = proposal
-        self._save_to_disk()
+        self._mark_dirty("proposals", proposal.proposal_id)
         return proposal.proposal_id
 
     def get_proposal(self, proposal_id: str) -> Any | None:
@@ -538,25 +902,31 @@ class InMemoryRepository(ConversationRepository):
 
     def list_proposals(self, limit: int = 100, offset: int = 0) -> list[Any]:
         """List proposals with pagination."""
-        proposals = list(self._proposals.values())
-        proposals.sort(key=lambda p: p.created_at, reverse=True)
-        return proposals[offset:offset + limit]
+        top = heapq.nlargest(offset + limit, self._proposals.values(), key=lambda p: p.created_at)
+        return top[offset:offset + limit]
 
 
 # Global repository instance
 _repository: ConversationRepository | None = None
+_repository_lock = threading.Lock()
 
 
-@lru_cache
 def get_repository(data_dir: str | None = None) -> ConversationRepository:
-    """Get the repository instance (singleton)."""
+    """Get the repository instance (singleton).
+    
+    ``data_dir`` only applies to the first call, which creates the
+    instance; later calls return it unchanged until ``set_repository``.
+    """
     global _repository
     if _repository is None:
-        _repository = InMemoryRepository(data_dir=data_dir or "./data")
+        with _repository_lock:
+            if _repository is None:
+                _repository = InMemoryRepository(data_dir=data_dir or "./data")
     return _repository
 
 
 def set_repository(repo: ConversationRepository) -> None:
     """Set a custom repository (useful for testing)."""
     global _repository
-    _repository = repo
+    with _repository_lock:
+        _repository = repo
@@ -0,0 +1,43 @@
+"""Array kernels behind HeuristicEvaluator's per-turn threshold checks.
+
+Kept free of model types so they operate purely on the contiguous arrays
+from ``Conversation.turn_arrays()``.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class TurnScan(NamedTuple):
+    """Per-turn masks produced by ``scan_turns``, aligned with the turns."""
+    empty: np.ndarray
+    too_long: np.ndarray
+    too_slow: np.ndarray
+    assistant_turns: int
+
+
+def scan_turns(
+    lengths: np.ndarray,
+    is_blank: np.ndarray,
+    is_assistant: np.ndarray,
+    latency_ms: np.ndarray,
+    max_length: int,
+    max_latency_ms: float,
+) -> TurnScan:
+    """Flag empty, over-long and slow (assistant-only) turns in one pass each.
+
+    ``empty`` is ``is_blank``, so it covers whitespace-only content too.
+    """
+    return TurnScan(
+        empty=is_blank,
+        too_long=lengths > max_length,
+        too_slow=is_assistant & (latency_ms > max_latency_ms),
+        assistant_turns=int(np.count_nonzero(is_assistant)),
+    )
+
+
+def issue_counts(scan: TurnScan) -> tuple[int, int]:
+    """Return ``(format_issues, latency_issues)`` for a scan."""
+    format_issues = int(np.count_nonzero(scan.empty)) + int(np.count_nonzero(scan.too_long))
+    return format_issues, int(np.count_nonzero(scan.too_slow))
@@ -1,36 +1,104 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import replace
+from enum import Enum
+import threading
 import time
 from typing import ClassVar, Any
 from src.models import Conversation, EvaluatorResult
 
+# Attribute types that make up an evaluator's configuration for cache keys;
+# anything else (clients, factories) is runtime plumbing and is ignored.
+_CONFIG_TYPES = (str, int, float, bool, type(None), Enum, list, tuple, dict)
+
+
 class Evaluator(ABC):
     """Abstract base class for all evaluation strategies.
     
     This defines the formal interface that all evaluators must follow.
+    
+    Results are memoized in a bounded LRU cache shared by all evaluators,
+    keyed by evaluator name, configuration and ``Conversation.content_digest``
+    (ID, turns and metadata), so re-evaluating an unchanged conversation
+    skips ``_evaluate``; hits are marked ``metadata["cache"] = "hit"``. Set
+    ``cache_results = False`` on strategies cheaper than building the key.
     """
     
-    @property
-    @abstractmethod
-    def evaluator_name(self) -> str:
-        """Return the unique name of this evaluator."""
-        pass
+    # Unique name of this evaluator; set on each subclass so the registry
+    # can read it without instantiating the class.
+    evaluator_name: ClassVar[str]
+    
+    # True for strategies that mostly wait on the network (e.g. LLM calls);
+    # only these are worth running on a separate thread per conversation.
+    io_bound: ClassVar[bool] = False
+    
+    cache_results: ClassVar[bool] = True
+    result_cache_size: ClassVar[int] = 1024
+    _result_cache: ClassVar[OrderedDict[tuple[str, str, str], EvaluatorResult]] = OrderedDict()
+    _result_cache_lock: ClassVar[threading.Lock] = threading.Lock()
     
     @abstractmethod
     def _evaluate(self, conversation: Conversation) -> EvaluatorResult:
         """Internal evaluation logic to be implemented by strategies."""
         pass
     
+    def _config_key(self) -> str:
+        """Describe the configuration that affects results, for cache keys.
+        
+        Built on first use and kept; configuration is fixed once an
+        evaluator has run.
+        """
+        key = self.__dict__.get("_config_key_value")
+        if key is None:
+            key = repr(sorted(
+                (name, value) for name, value in vars(self).items()
+                if isinstance(value, _CONFIG_TYPES)
+            ))
+            self._config_key_value = key
+        return key
+    
+    def _cache_key(self, conversation: Conversation) -> tuple[str, str, str] | None:
+        """Build the result-cache key, or None if the content can't be digested."""
+        digest = conversation.content_digest()
+        if digest is None:
+            return None
+        return self.evaluator_name, self._config_key(), digest
+    
     def evaluate(self, conversation: Conversation) -> EvaluatorResult:
-        """Template method to handle orchestration, timing, and error safety."""
+        """Template method to handle orchestration, timing, caching and error safety."""
         start_time = time.perf_counter()
+        key = self._cache_key(conversation) if self.cache_results else None
+        if key is not None:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    self._result_cache.move_to_end(key)
+            if cached is not None:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                return replace(
+                    cached,
+                    scores=dict(cached.scores),
+                    latency_ms=latency_ms,
+                    metadata={**cached.metadata, "latency_ms": latency_ms, "cache": "hit"},
+                )
         try:
             result = self._evaluate(conversation)
             latency_ms = (time.perf_counter() - start_time) * 1000
             
             # Enrich result with metadata
-            result.latency_ms = latency_ms
-            result.metadata = {**(result.metadata or {}), "latency_ms": latency_ms}
+            result = replace(
+                result,
+                latency_ms=latency_ms,
+                metadata={**(result.metadata or {}), "latency_ms": latency_ms},
+            )
+            if key is not None and "error" not in result.metadata:
+                # Store a copy so callers mutating their result can't alter the cache
+                snapshot = replace(result, scores=dict(result.scores), metadata=dict(result.metadata))
+                with self._result_cache_lock:
+                    self._result_cache[key] = snapshot
+                    if len(self._result_cache) > self.result_cache_size:
+                        self._result_cache.popitem(last=False)
             return result
         except Exception as e:
             latency_ms = (time.perf_counter() - start_time) * 1000
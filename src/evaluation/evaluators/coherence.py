@@ -11,9 +11,13 @@ Scores (0-1):
 - reference_accuracy: How well references are resolved
 """
 
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Any
 import re
 
+import numpy as np
+
 from .base import Evaluator
 from .registry import register_evaluator
 from src.models import (
@@ -54,6 +58,111 @@ CONTRADICTION_PATTERNS = [
     (r"\bare\b", r"\baren't\b"),
 ]
 
+# Phrases indicating the assistant lost earlier context
+CONTEXT_LOSS_PHRASES = (
+    "i don't have access to",
+    "i cannot see",
+    "you haven't told me",
+    "could you remind me",
+    "what was your",
+    "i'm not sure what you",
+)
+
+# Phrases indicating failed reference resolution
+FAILED_RESOLUTION_PHRASES = (
+    "not sure what you mean by",
+    "unclear what",
+    "which one do you mean",
+    "can you clarify",
+    "what do you mean by",
+)
+
+
+def _phrase_union(phrases: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile phrases into one alternation; group ``p<i>`` marks phrase i."""
+    return re.compile("|".join(f"(?P<p{i}>{re.escape(p)})" for i, p in enumerate(phrases)))
+
+
+def _matched_phrases(union: re.Pattern[str], phrases: tuple[str, ...], text: str) -> list[str]:
+    """Return the phrases occurring in text, in declaration order, scanning it once."""
+    hits = {int(m.lastgroup[1:]) for m in union.finditer(text)}
+    return [phrases[i] for i in sorted(hits)]
+
+
+def _shares_more_than(a: frozenset[str], b: frozenset[str], threshold: int) -> bool:
+    """Whether a and b have more than threshold common items, stopping early."""
+    if len(a) > len(b):
+        a, b = b, a
+    shared = 0
+    for item in a:
+        if item in b:
+            shared += 1
+            if shared > threshold:
+                return True
+    return False
+
+
+# Turn canonicalizes role strings, so identity checks suffice
+_USER = Role.USER
+_ASSISTANT = Role.ASSISTANT
+
+# Below this many assistant turns the plain pair loop beats NumPy's setup cost.
+_VECTORIZE_MIN_TURNS = 16
+
+
+def _contradiction_pairs(pos_mask: list[int], neg_mask: list[int]) -> list[tuple[int, int]]:
+    """Return index pairs (i < j) whose cue bitmasks contradict, in (i, j) order.
+    
+    Long conversations test all pairs at once with broadcast integer ANDs
+    over the upper triangle; short ones use a plain loop.
+    """
+    n = len(pos_mask)
+    if n < _VECTORIZE_MIN_TURNS:
+        return [
+            (i, j)
+            for i in range(n)
+            for j in range(i + 1, n)
+            if (pos_mask[i] & neg_mask[j]) | (neg_mask[i] & pos_mask[j])
+        ]
+    pos = np.asarray(pos_mask, dtype=np.uint32)
+    neg = np.asarray(neg_mask, dtype=np.uint32)
+    clash = (pos[:, None] & neg[None, :]) | (neg[:, None] & pos[None, :])
+    rows, cols = np.nonzero(np.triu(clash, k=1))
+    return list(zip(rows.tolist(), cols.tolist()))
+
+
+# Compiled once at import; these run for every turn (and turn pair).
+# Each union scans a turn once instead of once per pattern/phrase.
+_REFERENCE_UNION = re.compile("|".join(f"(?:{p})" for p in REFERENCE_PATTERNS), re.IGNORECASE)
+_CONTEXT_LOSS_UNION = _phrase_union(CONTEXT_LOSS_PHRASES)
+_FAILED_RESOLUTION_UNION = _phrase_union(FAILED_RESOLUTION_PHRASES)
+_CONTRADICTION_RE = [(re.compile(a), re.compile(b)) for a, b in CONTRADICTION_PATTERNS]
+_ENTITY_CAP_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_ENTITY_QUOTE_RE = re.compile(r'"([^"]+)"')
+_ENTITY_NUM_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_ENTITY_DATE_RE = re.compile(r'\b\d{4}-\d{2}-\d{2}\b')
+
+
+@lru_cache(maxsize=4096)
+def _extract_entities_cached(text: str) -> frozenset[int]:
+    """Extract key entities from text as string hashes, memoized on content.
+    
+    Hashes make overlap tests compare ints instead of strings; a rare
+    collision only nudges the score. Re-evaluation runs see the same turn
+    text many times, and the frozenset result is safe to share.
+    """
+    # Extract capitalized words (likely proper nouns/entities)
+    entities = set(map(hash, _ENTITY_CAP_RE.findall(text)))
+    
+    # Extract quoted strings
+    entities.update(map(hash, _ENTITY_QUOTE_RE.findall(text)))
+    
+    # Extract numbers and dates
+    entities.update(map(hash, _ENTITY_NUM_RE.findall(text)))
+    entities.update(map(hash, _ENTITY_DATE_RE.findall(text)))
+    
+    return frozenset(entities)
+
 
 @register_evaluator
 class CoherenceEvaluator(Evaluator):
@@ -64,6 +173,8 @@ class CoherenceEvaluator(Evaluator):
         context_window: Number of previous turns to consider for context
     """
     
+    evaluator_name = "coherence"
+    
     def __init__(
         self,
         min_turns_for_eval: int = 3,
@@ -72,87 +183,57 @@ class CoherenceEvaluator(Evaluator):
         self.min_turns_for_eval = min_turns_for_eval
         self.context_window = context_window
     
-    @property
-    def evaluator_name(self) -> str:
-        return "coherence"
-    
-    def _extract_key_entities(self, text: str) -> set[str]:
+    def _extract_key_entities(self, text: str) -> frozenset[int]:
         """Extract potential key entities from text (simplified)."""
-        # Extract capitalized words (likely proper nouns/entities)
-        entities = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text))
-        
-        # Extract quoted strings
-        quotes = set(re.findall(r'"([^"]+)"', text))
-        entities.update(quotes)
-        
-        # Extract numbers and dates
-        numbers = set(re.findall(r'\b\d+(?:\.\d+)?\b', text))
-        dates = set(re.findall(r'\b\d{4}-\d{2}-\d{2}\b', text))
-        entities.update(numbers)
-        entities.update(dates)
-        
-        return entities
+        return _extract_entities_cached(text)
     
     def _check_context_retention(
         self, 
-        conversation: Conversation
+        user_turns: list[Turn],
+        assistant_turns: list[Turn],
+        assistant_lowered: list[str],
     ) -> tuple[float, list[Issue]]:
         """Check if important context is retained across turns."""
         issues = []
         
         # Build context from user turns
-        user_entities_by_turn: dict[int, set[str]] = {}
-        for turn in conversation.turns:
-            if turn.role == Role.USER:
-                entities = self._extract_key_entities(turn.content)
-                if entities:
-                    user_entities_by_turn[turn.turn_id] = entities
+        user_entities_by_turn: dict[int, frozenset[int]] = {}
+        for turn in user_turns:
+            entities = self._extract_key_entities(turn.content)
+            if entities:
+                user_entities_by_turn[turn.turn_id] = entities
         
         # Check if assistant turns reference earlier entities
         context_hits = 0
         context_checks = 0
         
-        assistant_turns = [t for t in conversation.turns if t.role == Role.ASSISTANT]
+        # Sorted by turn_id so the user turns preceding an assistant turn
+        # are a prefix found by bisection.
+        user_items = sorted(user_entities_by_turn.items())
+        user_turn_ids = [turn_id for turn_id, _ in user_items]
+        user_entity_sets = [entities for _, entities in user_items]
         
-        for i, turn in enumerate(assistant_turns):
-            if i == 0:
-                continue  # Skip first assistant turn
-            
+        for turn in assistant_turns[1:]:  # Skip first assistant turn
             turn_entities = self._extract_key_entities(turn.content)
             
-            # Check for references to earlier context
-            for ref_turn_id, ref_entities in user_entities_by_turn.items():
-                if ref_turn_id < turn.turn_id:
-                    # Check if any earlier entity appears in current turn
-                    overlap = turn_entities & ref_entities
-                    if overlap:
-                        context_hits += 1
-                    context_checks += 1
+            # Check if any earlier entity appears in current turn
+            earlier = bisect_left(user_turn_ids, turn.turn_id)
+            context_checks += earlier
+            for ref_entities in user_entity_sets[:earlier]:
+                if not turn_entities.isdisjoint(ref_entities):
+                    context_hits += 1
         
         # Check for context loss patterns
-        for i, turn in enumerate(assistant_turns):
-            content_lower = turn.content.lower()
-            
-            # Phrases indicating context loss
-            context_loss_phrases = [
-                "i don't have access to",
-                "i cannot see",
-                "you haven't told me",
-                "could you remind me",
-                "what was your",
-                "i'm not sure what you",
-            ]
-            
-            for phrase in context_loss_phrases:
-                if phrase in content_lower and i > 0:
-                    # Check if context was actually provided earlier
-                    issues.append(Issue(
-                        issue_type=IssueType.CONTEXT_LOSS,
-                        severity=IssueSeverity.MEDIUM,
-                        description=f"Possible context loss at turn {turn.turn_id}: '{phrase}'",
-                        turn_id=turn.turn_id,
-                        details={"phrase": phrase},
-                    ))
+        for turn, content_lower in zip(assistant_turns[1:], assistant_lowered[1:]):
+            for phrase in _matched_phrases(_CONTEXT_LOSS_UNION, CONTEXT_LOSS_PHRASES, content_lower):
+                # Check if context was actually provided earlier
+                issues.append(Issue(
+                    issue_type=IssueType.CONTEXT_LOSS,
+                    severity=IssueSeverity.MEDIUM,
+                    description=f"Possible context loss at turn {turn.turn_id}: '{phrase}'",
+                    turn_id=turn.turn_id,
+                    details={"phrase": phrase},
+                ))
         
         # Compute score
         if context_checks == 0:
@@ -164,51 +245,50 @@ class CoherenceEvaluator(Evaluator):
     
     def _check_consistency(
         self, 
-        conversation: Conversation
+        assistant_turns: list[Turn],
+        assistant_lowered: list[str],
     ) -> tuple[float, list[Issue]]:
         """Check for contradictory statements across turns."""
         issues = []
         inconsistencies = 0
         
-        assistant_turns = [t for t in conversation.turns if t.role == Role.ASSISTANT]
-        
         if len(assistant_turns) < 2:
             return 1.0, []
         
+        # Precompute per-turn features once: bit k of pos_mask/neg_mask is set
+        # when the k-th positive/negative CONTRADICTION_PATTERNS entry matches.
+        pos_mask: list[int] = []
+        neg_mask: list[int] = []
+        word_sets: list[frozenset[str]] = []
+        for content in assistant_lowered:
+            pos = neg = 0
+            for bit, (pos_re, neg_re) in enumerate(_CONTRADICTION_RE):
+                if pos_re.search(content):
+                    pos |= 1 << bit
+                if neg_re.search(content):
+                    neg |= 1 << bit
+            pos_mask.append(pos)
+            neg_mask.append(neg)
+            word_sets.append(frozenset(content.split()))
+        
         # Simple contradiction detection
-        for i in range(len(assistant_turns)):
-            for j in range(i + 1, len(assistant_turns)):
+        # Very simplified - in production would use semantic similarity
+        for i, j in _contradiction_pairs(pos_mask, neg_mask):
+            # Only flag if similar topics (share some words)
+            if _shares_more_than(word_sets[i], word_sets[j], 5):  # Arbitrary threshold
                 turn_i = assistant_turns[i]
                 turn_j = assistant_turns[j]
-                
-                content_i = turn_i.content.lower()
-                content_j = turn_j.content.lower()
-                
-                # Check for potential contradictions
-                for pos_pattern, neg_pattern in CONTRADICTION_PATTERNS:
-                    has_pos_i = bool(re.search(pos_pattern, content_i))
-                    has_neg_j = bool(re.search(neg_pattern, content_j))
-                    has_neg_i = bool(re.search(neg_pattern, content_i))
-                    has_pos_j = bool(re.search(pos_pattern, content_j))
-                    
-                    # Very simplified - in production would use semantic similarity
-                    if (has_pos_i and has_neg_j) or (has_neg_i and has_pos_j):
-                        # Only flag if similar topics (share some words)
-                        words_i = set(content_i.split())
-                        words_j = set(content_j.split())
-                        if len(words_i & words_j) > 5:  # Arbitrary threshold
-                            issues.append(Issue(
-                                issue_type=IssueType.INCONSISTENT_RESPONSE,
-                                severity=IssueSeverity.LOW,
-                                description=f"Potential inconsistency between turns {turn_i.turn_id} and {turn_j.turn_id}",
-                                turn_id=turn_j.turn_id,
-                                details={
-                                    "turn_a": turn_i.turn_id,
-                                    "turn_b": turn_j.turn_id,
-                                },
-                            ))
-                            inconsistencies += 1
-                            break
+                issues.append(Issue(
+                    issue_type=IssueType.INCONSISTENT_RESPONSE,
+                    severity=IssueSeverity.LOW,
+                    description=f"Potential inconsistency between turns {turn_i.turn_id} and {turn_j.turn_id}",
+                    turn_id=turn_j.turn_id,
+                    details={
+                        "turn_a": turn_i.turn_id,
+                        "turn_b": turn_j.turn_id,
+                    },
+                ))
+                inconsistencies += 1
         
         # Compute score
         total_pairs = len(assistant_turns) * (len(assistant_turns) - 1) / 2
@@ -221,41 +301,27 @@ class CoherenceEvaluator(Evaluator):
     
     def _check_reference_handling(
         self, 
-        conversation: Conversation
+        assistant_turns: list[Turn],
+        assistant_lowered: list[str],
     ) -> tuple[float, list[Issue]]:
         """Check if references (pronouns, 'that', etc.) are handled correctly."""
         issues = []
         reference_count = 0
         unresolved_count = 0
         
-        assistant_turns = [t for t in conversation.turns if t.role == Role.ASSISTANT]
-        
-        for turn in assistant_turns:
-            content = turn.content.lower()
-            
-            for pattern in REFERENCE_PATTERNS:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                reference_count += len(matches)
+        for turn, content in zip(assistant_turns, assistant_lowered):
+            reference_count += len(_REFERENCE_UNION.findall(content))
             
             # Check for phrases indicating failed reference resolution
-            failed_resolution_phrases = [
-                "not sure what you mean by",
-                "unclear what",
-                "which one do you mean",
-                "can you clarify",
-                "what do you mean by",
-            ]
-            
-            for phrase in failed_resolution_phrases:
-                if phrase in content:
-                    unresolved_count += 1
-                    issues.append(Issue(
-                        issue_type=IssueType.REFERENCE_ERROR,
-                        severity=IssueSeverity.LOW,
-                        description=f"Reference resolution issue at turn {turn.turn_id}",
-                        turn_id=turn.turn_id,
-                        details={"phrase": phrase},
-                    ))
+            for phrase in _matched_phrases(_FAILED_RESOLUTION_UNION, FAILED_RESOLUTION_PHRASES, content):
+                unresolved_count += 1
+                issues.append(Issue(
+                    issue_type=IssueType.REFERENCE_ERROR,
+                    severity=IssueSeverity.LOW,
+                    description=f"Reference resolution issue at turn {turn.turn_id}",
+                    turn_id=turn.turn_id,
+                    details={"phrase": phrase},
+                ))
         
         # Compute score (penalize unresolved references)
         if reference_count == 0:
@@ -283,10 +349,25 @@ class CoherenceEvaluator(Evaluator):
                 },
             )
         
+        # Split turns by role once; every check below reuses these
+        user_turns: list[Turn] = []
+        assistant_turns: list[Turn] = []
+        for turn in conversation.turns:
+            role = turn.role
+            if role is _USER:
+                user_turns.append(turn)
+            elif role is _ASSISTANT:
+                assistant_turns.append(turn)
+        
+        # Lowercase each assistant turn once for all checks
+        assistant_lowered = [turn.content.lower() for turn in assistant_turns]
+        
         # Run coherence checks
-        context_score, context_issues = self._check_context_retention(conversation)
-        consistency_score, consistency_issues = self._check_consistency(conversation)
-        reference_score, reference_issues = self._check_reference_handling(conversation)
+        context_score, context_issues = self._check_context_retention(
+            user_turns, assistant_turns, assistant_lowered
+        )
+        consistency_score, consistency_issues = self._check_consistency(assistant_turns, assistant_lowered)
+        reference_score, reference_issues = self._check_reference_handling(assistant_turns, assistant_lowered)
         
         # Aggregate issues
         all_issues = context_issues + consistency_issues + reference_issues
@@ -1,26 +1,61 @@
 from __future__ import annotations
 import importlib
 import pkgutil
-from typing import List
+from typing import ClassVar, List
 from .registry import EvaluatorRegistry
 import src.evaluation.evaluators as evaluators_pkg
 
+# Strategy modules shipped with the package, imported in this order.
+# Modules found in the package but missing here are still picked up by the
+# directory scan, after these.
+EVALUATOR_MODULES: tuple[str, ...] = (
+    "coherence",
+    "heuristic",
+    "llm_judge",
+    "tool_call",
+    "tool_causality",
+)
+
+# Infrastructure modules that never contain strategies.
+_NON_STRATEGY_MODULES = frozenset({"base", "registry", "discovery", "_heuristic_kernels"})
+
+
 class EvaluatorDiscovery:
     """Discovery Service for finding and loading evaluation strategies.
     
     This encapsulates the filesystem logic, keeping it out of the Registry and Service.
     """
     
+    # Modules loaded by discovery, once every one of them imported cleanly
+    _manifest_loaded: ClassVar[List[str] | None] = None
+    
     @staticmethod
-    def discover_and_register(registry: EvaluatorRegistry) -> List[str]:
-        """Scans the evaluators package and registers all found strategies."""
+    def _scan_module_names() -> List[str]:
+        """List strategy modules by walking the package directory."""
+        return [
+            name
+            for _, name, is_pkg in pkgutil.iter_modules(evaluators_pkg.__path__)
+            if not is_pkg and name not in _NON_STRATEGY_MODULES
+        ]
+    
+    @staticmethod
+    def discover_and_register(registry: EvaluatorRegistry, scan: bool = False) -> List[str]:
+        """Imports the known strategy modules so they register themselves.
+        
+        Imports the ``EVALUATOR_MODULES`` manifest first, then any other
+        module the package directory contains, so new evaluators register
+        without editing the manifest. Once everything has loaded cleanly,
+        later calls return immediately; pass ``scan=True`` to force a fresh
+        walk of the package (e.g. after adding a module at runtime).
+        """
+        if not scan and EvaluatorDiscovery._manifest_loaded is not None:
+            return list(EvaluatorDiscovery._manifest_loaded)
+        
         loaded_modules = []
+        scanned = EvaluatorDiscovery._scan_module_names()
+        names = list(EVALUATOR_MODULES) + [n for n in scanned if n not in EVALUATOR_MODULES]
         
-        # Iterates over all modules in the src.evaluation.evaluators package
-        for _, name, is_pkg in pkgutil.iter_modules(evaluators_pkg.__path__):
-            if is_pkg or name in ['base', 'registry', 'discovery']:
-                continue
-                
+        for name in names:
             module_path = f"src.evaluation.evaluators.{name}"
             try:
                 # Importing the module triggers the @register_evaluator decorator
@@ -28,5 +63,7 @@ class EvaluatorDiscovery:
                 loaded_modules.append(module_path)
             except Exception as e:
                 print(f"Warning: Discovery failed for {module_path}: {e}")
-                
-        return loaded_modules
+        
+        if len(loaded_modules) == len(names):
+            EvaluatorDiscovery._manifest_loaded = loaded_modules
+        return list(loaded_modules)
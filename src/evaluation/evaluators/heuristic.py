@@ -11,6 +11,11 @@ Scores (0-1):
 - latency_ok: Whether response latencies are within threshold
 """
 
+import math
+
+import numpy as np
+
+from ._heuristic_kernels import issue_counts, scan_turns
 from .base import Evaluator
 from .registry import register_evaluator
 from src.models import (
@@ -39,6 +44,10 @@ class HeuristicEvaluator(Evaluator):
         required_metadata_fields: List of required metadata fields
     """
     
+    evaluator_name = "heuristic"
+    # Cheaper to rerun than to build a result-cache key
+    cache_results = False
+    
     def __init__(
         self,
         max_latency_ms: float = DEFAULT_MAX_LATENCY_MS,
@@ -49,19 +58,23 @@ class HeuristicEvaluator(Evaluator):
         self.max_turn_length = max_turn_length
         self.required_metadata_fields = required_metadata_fields or []
     
-    @property
-    def evaluator_name(self) -> str:
-        return "heuristic"
+    @staticmethod
+    def _empty_content_issue(turn: Turn) -> Issue:
+        """Build the issue for a turn with empty or whitespace-only content."""
+        return Issue(
+            issue_type=IssueType.FORMAT_ERROR,
+            severity=IssueSeverity.HIGH,
+            description=f"Turn {turn.turn_id} has empty content",
+            turn_id=turn.turn_id,
+            details={"role": turn.role},
+        )
     
     def _evaluate(self, conversation: Conversation) -> EvaluatorResult:
         """Perform heuristic checks on the conversation."""
         issues: list[Issue] = []
         
         # Track scores
-        format_issues = 0
         field_issues = 0
-        latency_issues = 0
-        total_assistant_turns = 0
         
         # Check required metadata fields
         for field in self.required_metadata_fields:
@@ -74,38 +87,60 @@ class HeuristicEvaluator(Evaluator):
                 ))
                 field_issues += 1
         
-        # Check each turn
-        for turn in conversation.turns:
-            # Format checks
-            if not turn.content or not turn.content.strip():
-                issues.append(Issue(
-                    issue_type=IssueType.FORMAT_ERROR,
-                    severity=IssueSeverity.HIGH,
-                    description=f"Turn {turn.turn_id} has empty content",
-                    turn_id=turn.turn_id,
-                    details={"role": turn.role.value},
-                ))
-                format_issues += 1
+        turns = conversation.turns
+        if self.max_turn_length == math.inf and self.max_latency_ms == math.inf:
+            # Length and latency checks are disabled, so only empty content
+            # can fail; skip building the turn arrays altogether.
+            total_assistant_turns = sum(1 for turn in turns if turn._is_assistant)
+            format_issues = latency_issues = 0
+            for turn in turns:
+                if not turn.content or turn.content.isspace():
+                    issues.append(self._empty_content_issue(turn))
+                    format_issues += 1
+        else:
+            # Threshold checks run vectorized over the turn arrays; only flagged
+            # turns are visited in Python to build their issues.
+            arrays = conversation.turn_arrays()
+            scan = scan_turns(
+                arrays.content_lengths,
+                arrays.is_blank,
+                arrays.is_assistant,
+                arrays.latency_ms,
+                self.max_turn_length,
+                self.max_latency_ms,
+            )
+            empty_mask, long_mask, late_mask = scan.empty, scan.too_long, scan.too_slow
+            total_assistant_turns = scan.assistant_turns
+            format_issues, latency_issues = issue_counts(scan)
             
-            # Length check
-            if len(turn.content) > self.max_turn_length:
-                issues.append(Issue(
-                    issue_type=IssueType.FORMAT_ERROR,
-                    severity=IssueSeverity.LOW,
-                    description=f"Turn {turn.turn_id} exceeds maximum length ({len(turn.content)} > {self.max_turn_length})",
-                    turn_id=turn.turn_id,
-                    details={"length": len(turn.content), "max": self.max_turn_length},
-                ))
-                format_issues += 1
+            # Constants bound to locals for the per-turn loop
+            FORMAT_ERROR = IssueType.FORMAT_ERROR
+            LATENCY_EXCEEDED = IssueType.LATENCY_EXCEEDED
+            LOW = IssueSeverity.LOW
+            MEDIUM = IssueSeverity.MEDIUM
+            
+            for i in np.flatnonzero(empty_mask | long_mask | late_mask):
+                turn = turns[i]
+            
+                # Format checks
+                if empty_mask[i]:
+                    issues.append(self._empty_content_issue(turn))
+            
+                # Length check
+                if long_mask[i]:
+                    issues.append(Issue(
+                        issue_type=FORMAT_ERROR,
+                        severity=LOW,
+                        description=f"Turn {turn.turn_id} exceeds maximum length ({turn._content_len} > {self.max_turn_length})",
+                        turn_id=turn.turn_id,
+                        details={"length": turn._content_len, "max": self.max_turn_length},
+                    ))
             
-            # Latency check (assistant turns only)
-            if turn.role == Role.ASSISTANT:
-                total_assistant_turns += 1
-                
-                if turn.latency_ms is not None and turn.latency_ms > self.max_latency_ms:
+                # Latency check (assistant turns only)
+                if late_mask[i]:
                     issues.append(Issue(
-                        issue_type=IssueType.LATENCY_EXCEEDED,
-                        severity=IssueSeverity.MEDIUM,
+                        issue_type=LATENCY_EXCEEDED,
+                        severity=MEDIUM,
                         description=f"Turn {turn.turn_id} latency exceeded threshold ({turn.latency_ms:.0f}ms > {self.max_latency_ms}ms)",
                         turn_id=turn.turn_id,
                         details={
@@ -113,7 +148,6 @@ class HeuristicEvaluator(Evaluator):
                             "threshold_ms": self.max_latency_ms,
                         },
                     ))
-                    latency_issues += 1
         
         # Compute scores (1.0 = perfect, 0.0 = all failed)
         total_turns = len(conversation.turns)
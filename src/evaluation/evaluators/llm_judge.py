@@ -1,6 +1,11 @@
 from __future__ import annotations
+import asyncio
+import io
 import json
 import os
+import time
+from dataclasses import replace
+from pathlib import Path
 from typing import Any, List, Optional
 
 from .base import Evaluator
@@ -13,8 +18,9 @@ from src.models import (
     IssueSeverity,
 )
 from src.utils.llm import LLMClientFactory, LLMModel
+from src.utils.cache import CacheInterface, DiskCacheBackend, MemoryCacheBackend, SemanticCache, content_key
 from src.config import get_settings
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 
 # =============================================================================
@@ -41,6 +47,21 @@ class LLMEvaluationResponse(BaseModel):
 # Evaluation Prompt
 # =============================================================================
 
+# Part of the response cache key; bump whenever the prompts below change.
+PROMPT_VERSION = "1"
+
+# Embedding model for the optional semantic (near-match) response cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Endpoint the judge's Batch API requests target
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Response cache shared by judges without a cache directory; keys include
+# the model and prompt version, so sharing across instances is safe.
+_MEMORY_CACHE = MemoryCacheBackend(maxsize=4096)
+
+SYSTEM_PROMPT = "You are an expert conversation evaluator. Always respond in valid JSON."
+
 EVALUATION_PROMPT = """Evaluate the following conversation between a user and an AI assistant.
 
 Your task is to assess the quality of the assistant's responses and identify any issues.
@@ -70,28 +91,44 @@ Conversation to evaluate:
 JSON Object:"""
 
 
+def _parse_response(content: str) -> LLMEvaluationResponse:
+    """Parse and validate a judge response.
+    
+    ``model_validate_json`` decodes and validates in a single pass inside
+    pydantic-core, which measures faster than ``orjson.loads`` followed by
+    ``model_validate`` (that walks an intermediate dict). Invalid JSON
+    surfaces as ``ValidationError`` either way.
+    """
+    return LLMEvaluationResponse.model_validate_json(content)
+
+
 def _format_conversation(conversation: Conversation) -> str:
-    """Format conversation for LLM evaluation."""
-    lines = []
+    """Format conversation for LLM evaluation.
+    
+    The text doubles as the response-cache key, so its exact layout must
+    stay stable: one line per entry, a blank line after each turn.
+    """
+    buf = io.StringIO()
+    w = buf.write
     
     if conversation.metadata:
-        lines.append(f"Metadata: {json.dumps(conversation.metadata)}")
-        lines.append("")
+        w(f"Metadata: {json.dumps(conversation.metadata)}\n\n")
     
     for turn in conversation.turns:
-        role = turn.role.value.upper()
-        lines.append(f"[{role}] (Turn {turn.turn_id}):")
-        lines.append(turn.content)
+        w(f"[{turn.role.upper()}] (Turn {turn.turn_id}):\n")
+        w(turn.content)
+        w("\n")
         
         if turn.tool_calls:
-            lines.append("  Tool calls:")
+            w("  Tool calls:\n")
             for tc in turn.tool_calls:
-                lines.append(f"    - {tc.tool_name}({json.dumps(tc.parameters)})")
+                w(f"    - {tc.tool_name}({json.dumps(tc.parameters)})\n")
                 if tc.result:
-                    lines.append(f"    - Result: {str(tc.result)[:200]}...")
-        lines.append("")
-        
-    return "\n".join(lines)
+                    w(f"    - Result: {str(tc.result)[:200]}...\n")
+        w("\n")
+    
+    # Entries were newline-joined before; drop the final separator
+    return buf.getvalue()[:-1]
 
 
 @register_evaluator
@@ -102,19 +139,39 @@ class LLMJudgeEvaluator(Evaluator):
     still enforcing structured output through Pydantic parsing.
     """
     
+    evaluator_name = "llm_judge"
+    io_bound = True
+    # The response cache below owns deduplication for every path (evaluate,
+    # aevaluate_many, Batch API results), so skip the base result cache
+    cache_results = False
+    
     def __init__(
         self,
         factory: Optional[LLMClientFactory] = None,
         model: Optional[LLMModel] = None,
+        cache_dir: Path | None = None,
+        cache: Optional[CacheInterface] = None,
+        semantic_cache: bool = False,
+        sim_threshold: float = 0.97,
     ):
         settings = get_settings()
         self.factory = factory or LLMClientFactory()
         self.model = model or LLMModel.OPENAI_GPT_4_O
         self.is_mock = not (settings.openai_key or os.getenv("OPENAI_KEY"))
-    
-    @property
-    def evaluator_name(self) -> str:
-        return "llm_judge"
+        
+        # Validated responses keyed by (model, prompt version, conversation text);
+        # on disk when a cache directory is configured, otherwise in process memory
+        cache_dir = cache_dir or settings.llm_cache_dir
+        if cache is None:
+            cache = DiskCacheBackend(cache_dir) if cache_dir else _MEMORY_CACHE
+        self.cache = cache
+        
+        # Opt-in near-match reuse of verdicts for paraphrased conversations.
+        # Off by default so repeated runs stay deterministic.
+        self.semantic_cache = None
+        if semantic_cache:
+            semantic_dir = Path(cache_dir) / "semantic" if cache_dir else None
+            self.semantic_cache = SemanticCache(semantic_dir, threshold=sim_threshold)
     
     def _evaluate(self, conversation: Conversation) -> EvaluatorResult:
         """Evaluate conversation using LLM-as-Judge."""
@@ -122,32 +179,271 @@ class LLMJudgeEvaluator(Evaluator):
             return self._mock_result(conversation.conversation_id)
 
         try:
-            client = self.factory.get_client()
             conversation_text = _format_conversation(conversation)
             
+            cache_key = self._response_key(conversation_text)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return self._process_response(cached)
+            
+            client = self.factory.get_client()
+            embedding = None
+            if self.semantic_cache is not None:
+                embedding = self._embed(client, conversation_text)
+                cached = self._semantic_response(embedding)
+                if cached is not None:
+                    return self._process_response(cached)
+            
             # Call LLM with direct OpenAI client using JSON mode
-            response = client.chat.completions.create(
-                model=self.model.value,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": "You are an expert conversation evaluator. Always respond in valid JSON."},
-                    {"role": "user", "content": EVALUATION_PROMPT.format(conversation_text=conversation_text)},
-                ],
-                temperature=0.0,
-            )
+            response = client.chat.completions.create(**self._completion_kwargs(conversation_text))
+            return self._accept_response(response, cache_key, embedding)
+            
+        except Exception as e:
+            print(f"ERROR: LLMJudgeEvaluator failed: {str(e)}")
+            return self._error_result(conversation.conversation_id, str(e))
+
+    async def _aevaluate(self, conversation: Conversation, client: Any) -> EvaluatorResult:
+        """Async counterpart of ``_evaluate`` using an ``AsyncOpenAI`` client."""
+        if self.is_mock:
+            return self._mock_result(conversation.conversation_id)
+
+        try:
+            conversation_text = _format_conversation(conversation)
             
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from LLM")
-                
-            parsed_response = LLMEvaluationResponse.model_validate_json(content)
+            cache_key = self._response_key(conversation_text)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return self._process_response(cached)
             
-            return self._process_response(parsed_response)
+            embedding = None
+            if self.semantic_cache is not None:
+                embedding = await self._aembed(client, conversation_text)
+                cached = self._semantic_response(embedding)
+                if cached is not None:
+                    return self._process_response(cached)
+            
+            response = await client.chat.completions.create(**self._completion_kwargs(conversation_text))
+            return self._accept_response(response, cache_key, embedding)
             
         except Exception as e:
             print(f"ERROR: LLMJudgeEvaluator failed: {str(e)}")
             return self._error_result(conversation.conversation_id, str(e))
 
+    async def aevaluate_many(
+        self,
+        conversations: List[Conversation],
+        concurrency: int = 32,
+    ) -> List[EvaluatorResult]:
+        """Evaluate conversations concurrently, at most ``concurrency`` in flight.
+        
+        Results are returned in input order, each timed like ``evaluate``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        client = None if self.is_mock else self.factory.create_async_client()
+
+        async def bounded(conversation: Conversation) -> EvaluatorResult:
+            async with semaphore:
+                start_time = time.perf_counter()
+                result = await self._aevaluate(conversation, client)
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                return replace(
+                    result,
+                    latency_ms=latency_ms,
+                    metadata={**(result.metadata or {}), "latency_ms": latency_ms},
+                )
+
+        try:
+            return list(await asyncio.gather(*(bounded(c) for c in conversations)))
+        finally:
+            if client is not None:
+                await client.close()
+
+    def evaluate_many(
+        self,
+        conversations: List[Conversation],
+        concurrency: int = 32,
+    ) -> List[EvaluatorResult]:
+        """Synchronous wrapper around ``aevaluate_many``.
+        
+        Must not be called from a running event loop; await
+        ``aevaluate_many`` there instead.
+        """
+        return asyncio.run(self.aevaluate_many(conversations, concurrency))
+
+    # -------------------------------------------------------------------------
+    # Offline evaluation via the OpenAI Batch API (half price, results within
+    # the completion window instead of per-request round trips)
+    # -------------------------------------------------------------------------
+
+    def prepare_batch(self, conversations: List[Conversation], path: str | Path) -> Path:
+        """Write one Batch API request line per conversation to ``path``.
+        
+        Each line's ``custom_id`` is the conversation ID, which
+        ``collect_batch`` uses to match results back up.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            for conversation in conversations:
+                request = {
+                    "custom_id": conversation.conversation_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": self._completion_kwargs(_format_conversation(conversation)),
+                }
+                f.write(json.dumps(request) + "\n")
+        return path
+
+    def submit_batch(self, path: str | Path) -> str:
+        """Upload a prepared batch file and start the batch; returns its ID."""
+        client = self.factory.get_client()
+        with Path(path).open("rb") as f:
+            batch_file = client.files.create(file=f, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        conversations: Optional[List[Conversation]] = None,
+    ) -> Optional[dict[str, EvaluatorResult]]:
+        """Fetch a finished batch's results keyed by conversation ID.
+        
+        Returns None while the batch is still running. Pass the submitted
+        ``conversations`` to also store the responses in the exact-match
+        cache, so later ``evaluate`` calls on them are free.
+        """
+        client = self.factory.get_client()
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            print(f"Warning: Batch {batch_id} is not complete (status: {batch.status})")
+            return None
+        
+        cache_keys = {}
+        if self.cache is not None and conversations:
+            cache_keys = {
+                c.conversation_id: self._response_key(_format_conversation(c))
+                for c in conversations
+            }
+        
+        results: dict[str, EvaluatorResult] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                conversation_id = entry["custom_id"]
+                try:
+                    response = entry.get("response") or {}
+                    if response.get("status_code") != 200:
+                        raise ValueError(f"Batch request failed: {entry.get('error') or response}")
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    results[conversation_id] = self._accept_content(
+                        content, cache_keys.get(conversation_id), None
+                    )
+                except Exception as e:
+                    print(f"ERROR: LLMJudgeEvaluator batch result for {conversation_id} failed: {e}")
+                    results[conversation_id] = self._error_result(conversation_id, str(e))
+        return results
+
+    def _response_key(self, conversation_text: str) -> Optional[str]:
+        """Exact-match cache key, or None when no response cache is configured."""
+        if self.cache is None:
+            return None
+        return content_key(self.model.value, PROMPT_VERSION, conversation_text)
+
+    def _completion_kwargs(self, conversation_text: str) -> dict[str, Any]:
+        """Arguments for the judge's chat completion request (JSON mode)."""
+        return {
+            "model": self.model.value,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": EVALUATION_PROMPT.format(conversation_text=conversation_text)},
+            ],
+            "temperature": 0.0,
+        }
+
+    def _accept_response(
+        self,
+        response: Any,
+        cache_key: Optional[str],
+        embedding: Optional[list[float]],
+    ) -> EvaluatorResult:
+        """Validate a completion, populate the caches and convert it."""
+        return self._accept_content(response.choices[0].message.content, cache_key, embedding)
+
+    def _accept_content(
+        self,
+        content: Optional[str],
+        cache_key: Optional[str],
+        embedding: Optional[list[float]],
+    ) -> EvaluatorResult:
+        """Validate raw completion text, populate the caches and convert it."""
+        if not content:
+            raise ValueError("Empty response from LLM")
+            
+        parsed_response = _parse_response(content)
+        # The verdict is valid either way; a cache write failure only costs reuse
+        try:
+            if cache_key is not None:
+                self.cache.set(cache_key, content)
+            if embedding is not None:
+                self.semantic_cache.add(embedding, content)
+        except Exception as e:
+            print(f"Warning: Could not cache LLM judge response: {e!r}")
+        
+        return self._process_response(parsed_response)
+
+    def _cached_response(self, key: Optional[str]) -> Optional[LLMEvaluationResponse]:
+        """Load a cached response, evicting entries that no longer validate."""
+        if key is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        try:
+            return _parse_response(cached)
+        except ValidationError:
+            self.cache.delete(key)
+            return None
+
+    def _embed(self, client: Any, text: str) -> Optional[list[float]]:
+        """Embed text for the semantic cache; None (cache skipped) on failure."""
+        try:
+            response = client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Warning: Embedding failed, skipping semantic cache: {e}")
+            return None
+
+    async def _aembed(self, client: Any, text: str) -> Optional[list[float]]:
+        """Async counterpart of ``_embed``."""
+        try:
+            response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Warning: Embedding failed, skipping semantic cache: {e}")
+            return None
+
+    def _semantic_response(self, embedding: Optional[list[float]]) -> Optional[LLMEvaluationResponse]:
+        """Reuse the verdict of a sufficiently similar earlier conversation."""
+        if embedding is None:
+            return None
+        cached = self.semantic_cache.lookup(embedding)
+        if cached is None:
+            return None
+        try:
+            return _parse_response(cached)
+        except ValidationError:
+            return None
+
     def _process_response(self, response: LLMEvaluationResponse) -> EvaluatorResult:
         """Convert LLM response to internal EvaluatorResult."""
         type_mapping = {
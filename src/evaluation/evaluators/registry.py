@@ -13,10 +13,26 @@ class EvaluatorRegistry:
         self._strategies: Dict[str, Type[Evaluator]] = {}
     
     def register(self, strategy_cls: Type[Evaluator]) -> None:
-        """Register a strategy class by its name."""
-        # Instantiate once to get name if not static
-        temp_instance = strategy_cls()
-        self._strategies[temp_instance.evaluator_name] = strategy_cls
+        """Register a strategy class by its name.
+        
+        The name is normally a class attribute, so registering never runs
+        the strategy's ``__init__``; instances are only built by ``get``.
+        Strategies that still define ``evaluator_name`` as a property are
+        instantiated once to read it.
+        """
+        name = getattr(strategy_cls, "evaluator_name", None)
+        if not isinstance(name, str):
+            try:
+                name = strategy_cls().evaluator_name
+            except Exception as e:
+                raise TypeError(
+                    f"Cannot determine evaluator_name of {strategy_cls.__name__}: {e}"
+                ) from e
+            if not isinstance(name, str):
+                raise TypeError(
+                    f"{strategy_cls.__name__}.evaluator_name must be a str, got {type(name).__name__}"
+                )
+        self._strategies[name] = strategy_cls
     
     def get(self, name: str) -> Optional[Evaluator]:
         """Get a fresh instance of a strategy by name."""
@@ -13,7 +13,11 @@ Scores (0-1):
 - execution_success: Whether tool calls executed successfully
 """
 
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
 from typing import Any
+import json
 import re
 
 from .base import Evaluator
@@ -68,6 +72,26 @@ DEFAULT_TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
 }
 
 
+# Demo "active" schema written by the analysis service's schema proposals
+ACTIVE_SCHEMA_PATH = Path("artifacts/tools/active_tool_schema.json")
+
+
+@lru_cache(maxsize=8)
+def _load_schema(path: str, mtime_ns: int, size: int) -> dict[str, dict[str, Any]] | None:
+    """Parse a schema file; keyed on mtime and size so edits are picked up."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@lru_cache(maxsize=8192)
+def _matches(pattern: re.Pattern[str], value: str) -> bool:
+    """Memoized ``pattern.match(value)``; traces repeat the same dates/emails."""
+    return pattern.match(value) is not None
+
+
 @register_evaluator
 class ToolCallEvaluator(Evaluator):
     """Evaluator for tool call accuracy and correctness.
@@ -77,6 +101,10 @@ class ToolCallEvaluator(Evaluator):
         strict_mode: If True, unknown tools are flagged as hallucinations
     """
     
+    evaluator_name = "tool_call"
+    # Cheaper to rerun than to build a result-cache key
+    cache_results = False
+    
     def __init__(
         self,
         tool_schemas: dict[str, dict[str, Any]] | None = None,
@@ -85,29 +113,36 @@ class ToolCallEvaluator(Evaluator):
         # Allow a demo "active" schema override to showcase self-updating.
         self.tool_schemas = tool_schemas or self._load_active_schema() or DEFAULT_TOOL_SCHEMAS
         self.strict_mode = strict_mode
+        
+        # Per-tool lookups derived from the schemas once, not per tool call
+        self._required_params: dict[str, tuple[str, ...]] = {}
+        self._required_param_sets: dict[str, frozenset[str]] = {}
+        self._all_known_params: dict[str, frozenset[str]] = {}
+        self._compiled_patterns: dict[str, dict[str, re.Pattern[str]]] = {}
+        for tool, schema in self.tool_schemas.items():
+            required = tuple(schema.get("required_params", []))
+            self._required_params[tool] = required
+            self._required_param_sets[tool] = frozenset(required)
+            self._all_known_params[tool] = frozenset(required) | frozenset(schema.get("optional_params", []))
+            self._compiled_patterns[tool] = {
+                param: re.compile(pattern)
+                for param, pattern in schema.get("param_patterns", {}).items()
+            }
 
     def _load_active_schema(self) -> dict[str, dict[str, Any]] | None:
         """Load the active tool schema artifact if present."""
-        from pathlib import Path
-        import json
-
-        schema_path = Path("artifacts/tools/active_tool_schema.json")
-        if not schema_path.exists():
-            return None
         try:
-            data = json.loads(schema_path.read_text())
-        except json.JSONDecodeError:
-            return None
-        if not isinstance(data, dict):
+            stat = ACTIVE_SCHEMA_PATH.stat()
+        except FileNotFoundError:
             return None
-        return data
+        return _load_schema(str(ACTIVE_SCHEMA_PATH), stat.st_mtime_ns, stat.st_size)
     
-    @property
-    def evaluator_name(self) -> str:
-        return "tool_call"
-    
-    def _validate_tool_call(self, tool_call: ToolCall, turn_id: int) -> list[Issue]:
-        """Validate a single tool call against schema."""
+    def _validate_tool_call(self, tool_call: ToolCall, turn_id: int) -> tuple[list[Issue], int, int]:
+        """Validate a single tool call against schema.
+        
+        Returns the issues along with how many of them are parameter issues
+        and how many are tool hallucinations, so callers needn't re-scan them.
+        """
         issues: list[Issue] = []
         tool_name = tool_call.tool_name
         params = tool_call.parameters
@@ -122,17 +157,17 @@ class ToolCallEvaluator(Evaluator):
                     turn_id=turn_id,
                     details={"tool": tool_name, "known_tools": list(self.tool_schemas.keys())},
                 ))
-            return issues
+            return issues, 0, len(issues)
         
-        schema = self.tool_schemas[tool_name]
-        required_params = schema.get("required_params", [])
-        optional_params = schema.get("optional_params", [])
-        param_patterns = schema.get("param_patterns", {})
-        all_known_params = set(required_params + optional_params)
+        all_known_params = self._all_known_params[tool_name]
         
-        # Check for missing required params
-        for param in required_params:
-            if param not in params:
+        # Check for missing required params; set difference finds them in
+        # one step, the ordered tuple keeps issues in schema order
+        missing_params = self._required_param_sets[tool_name] - params.keys()
+        if missing_params:
+            for param in self._required_params[tool_name]:
+                if param not in missing_params:
+                    continue
                 issues.append(Issue(
                     issue_type=IssueType.MISSING_PARAM,
                     severity=IssueSeverity.HIGH,
@@ -143,8 +178,11 @@ class ToolCallEvaluator(Evaluator):
                 ))
         
         # Check for unknown params (possible hallucination)
-        for param in params.keys():
-            if param not in all_known_params and self.strict_mode:
+        unknown_params = params.keys() - all_known_params if self.strict_mode else ()
+        if unknown_params:
+            for param in params:
+                if param not in unknown_params:
+                    continue
                 issues.append(Issue(
                     issue_type=IssueType.INVALID_PARAM,
                     severity=IssueSeverity.MEDIUM,
@@ -154,10 +192,11 @@ class ToolCallEvaluator(Evaluator):
                 ))
         
         # Validate param patterns
-        for param, pattern in param_patterns.items():
+        for param, compiled in self._compiled_patterns[tool_name].items():
             if param in params:
                 value = str(params[param])
-                if not re.match(pattern, value):
+                if not _matches(compiled, value):
+                    pattern = compiled.pattern
                     issues.append(Issue(
                         issue_type=IssueType.INVALID_PARAM,
                         severity=IssueSeverity.HIGH,
@@ -172,44 +211,39 @@ class ToolCallEvaluator(Evaluator):
                         suggested_fix=f"Parameter '{param}' should match pattern: {pattern}",
                     ))
         
-        return issues
+        # Every issue for a known tool is a missing or invalid parameter
+        return issues, len(issues), 0
     
     def _evaluate(self, conversation: Conversation) -> EvaluatorResult:
         """Evaluate all tool calls in the conversation."""
-        issues: list[Issue] = []
+        # One list of issues per tool call, flattened once at the end
+        issue_chunks: list[list[Issue]] = []
         
         total_tool_calls = 0
-        selection_issues = 0
         param_issues = 0
         hallucination_issues = 0
         execution_failures = 0
         
         for turn in conversation.turns:
-            if turn.role != Role.ASSISTANT:
+            if not turn._is_assistant:
                 continue
             
             for tool_call in turn.tool_calls:
                 total_tool_calls += 1
                 
                 # Validate tool call
-                call_issues = self._validate_tool_call(tool_call, turn.turn_id)
-                issues.extend(call_issues)
-                
-                # Categorize issues
-                for issue in call_issues:
-                    if issue.issue_type == IssueType.TOOL_HALLUCINATION:
-                        hallucination_issues += 1
-                    elif issue.issue_type == IssueType.INVALID_TOOL:
-                        selection_issues += 1
-                    elif issue.issue_type in (IssueType.INVALID_PARAM, IssueType.MISSING_PARAM):
-                        param_issues += 1
+                call_issues, call_param_issues, call_hallucinations = self._validate_tool_call(
+                    tool_call, turn.turn_id
+                )
+                param_issues += call_param_issues
+                hallucination_issues += call_hallucinations
                 
                 # Check execution result
                 if tool_call.result is None:
                     # No result could mean execution failed or wasn't executed
                     pass
                 elif isinstance(tool_call.result, dict) and tool_call.result.get("error"):
-                    issues.append(Issue(
+                    call_issues.append(Issue(
                         issue_type=IssueType.EXECUTION_FAILED,
                         severity=IssueSeverity.HIGH,
                         description=f"Tool '{tool_call.tool_name}' execution failed",
@@ -220,6 +254,9 @@ class ToolCallEvaluator(Evaluator):
                         },
                     ))
                     execution_failures += 1
+                
+                if call_issues:
+                    issue_chunks.append(call_issues)
         
         # If no tool calls, return perfect scores
         if total_tool_calls == 0:
@@ -237,7 +274,6 @@ class ToolCallEvaluator(Evaluator):
             )
         
         # Compute scores
-        selection_score = 1.0 - (selection_issues / total_tool_calls)
         param_score = 1.0 - (param_issues / total_tool_calls)
         hallucination_score = 1.0 - (hallucination_issues / total_tool_calls)
         execution_score = 1.0 - (execution_failures / total_tool_calls)
@@ -245,16 +281,17 @@ class ToolCallEvaluator(Evaluator):
         return EvaluatorResult(
             evaluator_name=self.evaluator_name,
             scores={
-                "tool_selection": max(0.0, selection_score),
+                # No selection check exists yet (nothing knows the expected
+                # tool); kept at 1.0 so aggregate scores stay comparable.
+                "tool_selection": 1.0,
                 "param_accuracy": max(0.0, param_score),
                 "no_hallucination": max(0.0, hallucination_score),
                 "execution_success": max(0.0, execution_score),
             },
-            issues=tuple(issues),
+            issues=tuple(chain.from_iterable(issue_chunks)),
             confidence=0.95,  # High confidence for rule-based checks
             metadata={
                 "total_tool_calls": total_tool_calls,
-                "selection_issues": selection_issues,
                 "param_issues": param_issues,
                 "hallucination_issues": hallucination_issues,
                 "execution_failures": execution_failures,
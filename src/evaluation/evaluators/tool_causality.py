@@ -13,6 +13,15 @@ from src.models import (
     IssueSeverity,
 )
 
+_WORD_RE = re.compile(r'\w+')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Delimits seen entries in the search buffer; values containing it fall
+# back to a per-entry scan so matches never span two entries.
+_SEPARATOR = "\x00"
+_SEPARATOR_BYTES = _SEPARATOR.encode()
+
+
 @register_evaluator
 class ToolCausalityEvaluator(Evaluator):
     """Evaluator that verifies the provenance of tool parameters.
@@ -26,21 +35,32 @@ class ToolCausalityEvaluator(Evaluator):
     it is flagged as a likely hallucination.
     """
     
-    @property
-    def evaluator_name(self) -> str:
-        return "tool_causality"
+    evaluator_name = "tool_causality"
     
     def _extract_values(self, obj: Any) -> Set[str]:
-        """Recursively extract all string/number values from a dictionary or list."""
-        values = set()
-        if isinstance(obj, (str, int, float)):
-            values.add(str(obj).lower())
-        elif isinstance(obj, dict):
-            for v in obj.values():
-                values.update(self._extract_values(v))
-        elif isinstance(obj, (list, tuple)):
-            for item in obj:
-                values.update(self._extract_values(item))
+        """Extract all string/number values from a nested dictionary or list.
+        
+        Walks an explicit worklist into a single output set rather than
+        recursing and merging a fresh set per container.
+        """
+        values: Set[str] = set()
+        stack = [obj]
+        while stack:
+            item = stack.pop()
+            kind = type(item)
+            if kind is str:
+                values.add(item.lower())
+            elif kind is dict:
+                stack.extend(item.values())
+            elif kind is list or kind is tuple:
+                stack.extend(item)
+            elif isinstance(item, (str, int, float)):
+                # Numbers, bools and str subclasses, as before
+                values.add(str(item).lower())
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
         return values
 
     def _evaluate(self, conversation: Conversation) -> EvaluatorResult:
@@ -49,6 +69,11 @@ class ToolCausalityEvaluator(Evaluator):
         
         # This set will store all strings/data seen so far in the conversation
         seen_data: Set[str] = set()
+        # The same data packed into one growing UTF-8 buffer, so "is this value
+        # a substring of anything seen" is a single C-level search instead of
+        # a Python loop over seen_data. UTF-8 is self-synchronizing, so byte
+        # containment matches str containment.
+        seen_buffer = bytearray()
         
         total_checks = 0
         hallucinated_params = 0
@@ -57,36 +82,42 @@ class ToolCausalityEvaluator(Evaluator):
             # 1. Before checking the assistant's tool call, we update our 'seen_data'
             # with the user's current input and any previous turn content.
             # We also tokenize slightly to handle values inside sentences.
-            content_tokens = set(re.findall(r'\w+', turn.content.lower()))
+            content_lower = turn.content.lower()
+            content_tokens = set(_WORD_RE.findall(content_lower))
             seen_data.update(content_tokens)
             
             # Special case: values like "XY123" might be specific, let's also add the whole content
-            seen_data.add(turn.content.lower())
+            # (tokens are substrings of it, so only the whole content joins the haystack)
+            seen_data.add(content_lower)
+            seen_buffer += _SEPARATOR_BYTES
+            seen_buffer += content_lower.encode()
 
-            if turn.role == Role.ASSISTANT:
+            if turn._is_assistant:
                 for tool_call in turn.tool_calls:
                     param_values = self._extract_values(tool_call.parameters)
+                    # Skip empty or trivial single-chars
+                    candidates = {val for val in param_values if len(val) >= 2}
+                    total_checks += len(candidates)
+                    # Exact hits are settled by one set difference; only the
+                    # rest need the substring and date fallbacks
+                    missing = candidates - seen_data
                     non_grounded_params = []
                     
-                    for val in param_values:
-                        if not val or len(val) < 2: # Skip empty or trivial single-chars
+                    # Walk param_values (not the difference) to keep issue order stable
+                    for val in (param_values if missing else ()):
+                        if val not in missing:
                             continue
-                            
-                        total_checks += 1
                         
                         # Check if this specific value (or a substring of it) has been seen
-                        is_grounded = False
-                        if val in seen_data:
-                            is_grounded = True
+                        if _SEPARATOR in val:
+                            # Could match across buffered entries; check each one
+                            is_grounded = any(val in prev_data for prev_data in seen_data)
                         else:
                             # Direct substring search in previous content
-                            for prev_data in seen_data:
-                                if val in prev_data:
-                                    is_grounded = True
-                                    break
+                            is_grounded = val.encode() in seen_buffer
                         
                         # Fuzzy date fallback: If it's a date like YYYY-MM-DD, check if parts are seen
-                        if not is_grounded and re.match(r'^\d{4}-\d{2}-\d{2}$', val):
+                        if not is_grounded and _ISO_DATE_RE.match(val):
                             year, month, day = val.split('-')
                             # If year and day are mentioned, we consider the ISO format grounded (best effort)
                             if (year in seen_data or year[2:] in seen_data) and (day in seen_data or str(int(day)) in seen_data):
@@ -121,6 +152,9 @@ class ToolCausalityEvaluator(Evaluator):
                     if tool_call.result:
                         result_values = self._extract_values(tool_call.result)
                         seen_data.update(result_values)
+                        for value in result_values:
+                            seen_buffer += _SEPARATOR_BYTES
+                            seen_buffer += value.encode()
             
         # Compute score
         provenance_score = 1.0
@@ -1,5 +1,7 @@
 from __future__ import annotations
+import threading
 import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Optional
 
 from src.models import Conversation, EvaluationResult, EvaluatorResult
@@ -11,6 +13,64 @@ class EvaluationError(Exception):
     """Custom exception for evaluation-related errors."""
     pass
 
+
+def _resolve_strategies(registry: EvaluatorRegistry, names: List[str]) -> List[Evaluator]:
+    """Instantiate the named strategies, skipping any that are unavailable."""
+    strategies = []
+    for name in names:
+        try:
+            strategy = registry.get(name)
+        except Exception as e:
+            # Construction is deferred to here, so e.g. a missing API key
+            # only disables the evaluator that needs it.
+            print(f"Warning: Could not initialize evaluator '{name}': {e}")
+            continue
+        if strategy:
+            strategies.append(strategy)
+        else:
+            print(f"Warning: Configured evaluator '{name}' not found in registry.")
+    return strategies
+
+
+def _run_strategy(strategy: Evaluator, conversation: Conversation) -> tuple[str, EvaluatorResult]:
+    """Apply one strategy, converting unexpected failures into an error result."""
+    try:
+        return strategy.evaluator_name, strategy.evaluate(conversation)
+    except Exception as e:
+        print(f"ERROR: Strategy '{strategy.evaluator_name}' failed: {e}")
+        return strategy.evaluator_name, EvaluatorResult(
+            evaluator_name=strategy.evaluator_name,
+            scores={},
+            issues=(),
+            confidence=0.0,
+            metadata={"error": str(e)},
+        )
+
+
+def _run_strategy_many(strategy: Evaluator, conversations: List[Conversation]) -> List[EvaluatorResult]:
+    """Apply a batching strategy to many conversations, falling back to one at a time."""
+    try:
+        return strategy.evaluate_many(conversations)
+    except Exception as e:
+        print(f"Warning: Batch run of '{strategy.evaluator_name}' failed, evaluating individually: {e}")
+        return [_run_strategy(strategy, conversation)[1] for conversation in conversations]
+
+
+# Strategies of the current batch worker process, built once by _init_worker
+_worker_strategies: List[Evaluator] = []
+
+
+def _init_worker(registry: EvaluatorRegistry, enabled_evaluators: List[str]) -> None:
+    """Process-pool initializer: build the strategies once per worker."""
+    global _worker_strategies
+    _worker_strategies = _resolve_strategies(registry, enabled_evaluators)
+
+
+def _evaluate_in_worker(conversation: Conversation) -> List[tuple[str, EvaluatorResult]]:
+    """Run this worker's strategies on one conversation (in a child process)."""
+    return [_run_strategy(strategy, conversation) for strategy in _worker_strategies]
+
+
 class EvaluationService:
     """The Context in the Strategy Pattern.
     
@@ -34,28 +94,125 @@ class EvaluationService:
             enabled_evaluators = settings.enabled_evaluators
         
         self.enabled_evaluators = enabled_evaluators
+        
+        # Strategy instances are resolved on first use and then reused for
+        # every conversation; they hold configuration only, no per-call state.
+        self._strategies: Optional[List[Evaluator]] = None
+        self._strategies_lock = threading.Lock()
+        
+        # Worker processes for evaluate_batch, started on first use and kept
+        # until close() (or a strategy refresh) so workers build their
+        # strategies once, not once per batch.
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_size = 0
+        self._pool_lock = threading.Lock()
+        # Threads for IO-bound strategies and evaluate_batch, likewise
+        # started once and reused
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
 
     def _get_active_strategies(self) -> List[Evaluator]:
-        """Fetch instantiated strategy objects from the registry."""
-        strategies = []
-        for name in self.enabled_evaluators:
-            strategy = self.registry.get(name)
-            if strategy:
-                strategies.append(strategy)
-            else:
-                print(f"Warning: Configured evaluator '{name}' not found in registry.")
+        """Fetch instantiated strategy objects from the registry (cached)."""
+        strategies = self._strategies
+        if strategies is None:
+            with self._strategies_lock:
+                if self._strategies is None:
+                    self._strategies = _resolve_strategies(self.registry, self.enabled_evaluators)
+                strategies = self._strategies
         return strategies
 
+    def refresh_strategies(self) -> None:
+        """Rebuild the strategies, e.g. after evaluator config or artifacts change."""
+        strategies = _resolve_strategies(self.registry, self.enabled_evaluators)
+        with self._strategies_lock:
+            self._strategies = strategies
+        # Worker processes hold their own copies; start fresh ones next batch
+        self._shutdown_process_pool()
+
+    def _get_process_pool(self, process_workers: int) -> ProcessPoolExecutor:
+        """Return the worker-process pool, (re)starting it if needed."""
+        with self._pool_lock:
+            if self._process_pool is None or self._process_pool_size != process_workers:
+                if self._process_pool is not None:
+                    self._process_pool.shutdown(wait=False)
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=process_workers,
+                    initializer=_init_worker,
+                    initargs=(self.registry, self.enabled_evaluators),
+                )
+                self._process_pool_size = process_workers
+            return self._process_pool
+
+    def _shutdown_process_pool(self) -> None:
+        with self._pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Return the service's thread pool, starting it on first use."""
+        with self._pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=get_settings().max_workers,
+                    thread_name_prefix="evaluation",
+                )
+            return self._thread_pool
+
+    def close(self) -> None:
+        """Stop the service's worker threads and processes, if any were started."""
+        self._shutdown_process_pool()
+        with self._pool_lock:
+            pool, self._thread_pool = self._thread_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
     def evaluate(self, conversation_id: str) -> EvaluationResult:
         """Evaluate a single conversation by ID."""
+        return self.evaluate_conversation(self._load_conversation(conversation_id))
+
+    def _load_conversation(self, conversation_id: str) -> Conversation:
+        """Fetch a conversation or raise ``EvaluationError``."""
         conversation = self.repository.get_conversation(conversation_id)
         if conversation is None:
             raise EvaluationError(f"Conversation not found: {conversation_id}")
-        
-        return self.evaluate_conversation(conversation)
+        return conversation
 
     def evaluate_conversation(self, conversation: Conversation) -> EvaluationResult:
         """Evaluate a conversation object using the injected strategies."""
+        return self._complete(conversation, self._run_strategies(conversation))
+
+    def _run_strategies(
+        self,
+        conversation: Conversation,
+        strategies: Optional[List[Evaluator]] = None,
+    ) -> List[tuple[str, EvaluatorResult]]:
+        """Apply every active strategy (or just ``strategies``) to a conversation.
+        
+        IO-bound strategies (LLM calls) run on the service's thread pool
+        while the CPU-bound ones run inline, where extra threads would only
+        contend for the GIL.
+        """
+        if strategies is None:
+            strategies = self._get_active_strategies()
+        
+        io_bound = [s for s in strategies if s.io_bound]
+        if not io_bound or len(strategies) <= 1:
+            return [_run_strategy(strategy, conversation) for strategy in strategies]
+        pool = self._get_thread_pool()
+        futures = {s.evaluator_name: pool.submit(_run_strategy, s, conversation) for s in io_bound}
+        outcomes = [
+            futures[s.evaluator_name].result() if s.io_bound else _run_strategy(s, conversation)
+            for s in strategies
+        ]
+        return outcomes
+
+    def _complete(
+        self,
+        conversation: Conversation,
+        outcomes: List[tuple[str, EvaluatorResult]],
+        persist: bool = True,
+    ) -> EvaluationResult:
+        """Assemble, score and (unless ``persist`` is False) save the per-strategy results."""
         result = EvaluationResult(
             conversation_id=conversation.conversation_id,
             run_id=str(uuid.uuid4()),
@@ -63,26 +220,13 @@ class EvaluationService:
             status="pending",
         )
         
-        strategies = self._get_active_strategies()
-        if not strategies:
+        if not outcomes:
             result.status = "completed"
             result.aggregate_score = 0.0
             return result
         
-        # Apply each strategy
-        for strategy in strategies:
-            try:
-                eval_result = strategy.evaluate(conversation)
-                result.evaluations[strategy.evaluator_name] = eval_result
-            except Exception as e:
-                print(f"ERROR: Strategy '{strategy.evaluator_name}' failed: {e}")
-                result.evaluations[strategy.evaluator_name] = EvaluatorResult(
-                    evaluator_name=strategy.evaluator_name,
-                    scores={},
-                    issues=(),
-                    confidence=0.0,
-                    metadata={"error": str(e)},
-                )
+        for name, eval_result in outcomes:
+            result.evaluations[name] = eval_result
         
         # Post-processing
         result.compute_aggregate_score()
@@ -90,13 +234,102 @@ class EvaluationService:
         result.status = "completed"
         
         # Persist
-        self.repository.save_evaluation(result)
+        if persist:
+            self.repository.save_evaluation(result)
         
         return result
 
+    def _load_conversations(self, conversation_ids: List[str]) -> List[Conversation]:
+        """Fetch conversations in one repository call, or raise ``EvaluationError``."""
+        found = self.repository.get_conversations(conversation_ids)
+        for cid in conversation_ids:
+            if cid not in found:
+                raise EvaluationError(f"Conversation not found: {cid}")
+        return [found[cid] for cid in conversation_ids]
+
+    def _save_results(self, results: List[EvaluationResult]) -> None:
+        """Persist a batch's results in one repository call.
+        
+        The repository saves what it can; results it couldn't persist come
+        back marked ``status="failed"`` instead of failing the whole batch.
+        """
+        # Results without any strategy outcome are never saved (see _complete)
+        self.repository.save_evaluations([r for r in results if r.evaluations])
+
     def evaluate_batch(self, conversation_ids: List[str]) -> List[EvaluationResult]:
-        """Evaluate multiple conversations in sequence."""
-        return [self.evaluate(cid) for cid in conversation_ids]
+        """Evaluate multiple conversations concurrently, preserving input order.
+        
+        Uses worker processes when the ``process_workers`` setting is
+        positive (CPU-bound strategies then scale across cores), otherwise
+        a thread pool bounded by ``max_workers``. Conversations are fetched
+        and results saved with one batched repository call each.
+        """
+        if len(conversation_ids) <= 1:
+            return [self.evaluate(cid) for cid in conversation_ids]
+        conversations = self._load_conversations(conversation_ids)
+        settings = get_settings()
+        if settings.process_workers > 0:
+            results = self._evaluate_batch_in_processes(conversations, settings.process_workers)
+        else:
+            results = self._evaluate_batch_in_threads(conversations)
+        self._save_results(results)
+        return results
+
+    def _evaluate_batch_in_threads(
+        self,
+        conversations: List[Conversation],
+    ) -> List[EvaluationResult]:
+        """Run strategies on the service's thread pool, batching those that support it.
+        
+        Strategies with an ``evaluate_many`` method (e.g. the LLM judge,
+        which keeps many requests in flight at once) each get the whole
+        batch in one call; the rest run per conversation alongside them,
+        each conversation's strategies in turn on one pool thread.
+        """
+        strategies = self._get_active_strategies()
+        batched = [s for s in strategies if hasattr(s, "evaluate_many")]
+        single = [s for s in strategies if not hasattr(s, "evaluate_many")]
+        pool = self._get_thread_pool()
+        batch_futures = {
+            strategy.evaluator_name: pool.submit(_run_strategy_many, strategy, conversations)
+            for strategy in batched
+        }
+        single_outcomes = list(pool.map(
+            lambda c: [_run_strategy(strategy, c) for strategy in single], conversations
+        ))
+        batch_outcomes = {name: future.result() for name, future in batch_futures.items()}
+        
+        results = []
+        for i, (conversation, outcomes) in enumerate(zip(conversations, single_outcomes)):
+            by_name = dict(outcomes)
+            # Keep the configured strategy order in the assembled result
+            merged = [
+                (s.evaluator_name, batch_outcomes[s.evaluator_name][i] if s.evaluator_name in batch_outcomes
+                 else by_name[s.evaluator_name])
+                for s in strategies
+            ]
+            results.append(self._complete(conversation, merged, persist=False))
+        return results
+
+    def _evaluate_batch_in_processes(
+        self,
+        conversations: List[Conversation],
+        process_workers: int,
+    ) -> List[EvaluationResult]:
+        """Fan strategy execution out to worker processes.
+        
+        Results are assembled here in the parent, since the repository
+        isn't shared with the workers. The pool outlives the call, so each
+        worker builds its strategies once in its initializer.
+        """
+        pool = self._get_process_pool(process_workers)
+        workers = min(len(conversations), process_workers)
+        chunksize = max(1, len(conversations) // (workers * 4))
+        outcomes = list(pool.map(_evaluate_in_worker, conversations, chunksize=chunksize))
+        return [
+            self._complete(conversation, conversation_outcomes, persist=False)
+            for conversation, conversation_outcomes in zip(conversations, outcomes)
+        ]
 
     def evaluate_pending(self, force: bool = False) -> List[EvaluationResult]:
         """Evaluate all conversations that require processing."""
@@ -121,22 +354,25 @@ class EvaluationService:
 
     def get_summary_stats(self) -> dict:
         """Compute basic summary statistics across all evaluations."""
-        evals = self.repository.list_evaluations(limit=1000)
-        if not evals:
+        # One streaming pass; evaluations aren't held in memory together
+        count = 0
+        total_score = 0.0
+        issue_counts = {}
+        for e in self.repository.iter_evaluations(limit=1000):
+            count += 1
+            total_score += e.aggregate_score
+            for issue in e.issues:
+                issue_counts[issue.issue_type] = issue_counts.get(issue.issue_type, 0) + 1
+        
+        if not count:
             return {
                 "total_evaluations": 0,
                 "average_score": 0.0,
                 "issue_counts": {}
             }
-            
-        total_score = sum(e.aggregate_score for e in evals)
-        issue_counts = {}
-        for e in evals:
-            for issue in e.issues:
-                issue_counts[issue.issue_type.value] = issue_counts.get(issue.issue_type.value, 0) + 1
                 
         return {
-            "total_evaluations": len(evals),
-            "average_score": total_score / len(evals),
+            "total_evaluations": count,
+            "average_score": total_score / count,
             "issue_counts": issue_counts
         }
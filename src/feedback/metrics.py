@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections import Counter
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class AnnotationRecord:
@@ -34,6 +36,37 @@ def build_annotation_matrix(
     return matrix, item_ids, annotator_ids
 
 
+def build_encoded_matrix_from_columns(
+    item_ids: list[str],
+    annotator_ids: list[str],
+    labels: list[str],
+) -> tuple[np.ndarray, int, list[str], list[str]]:
+    """Build the integer-encoded item x annotator matrix from parallel columns.
+
+    Returns ``(codes, label_count, items, annotators)`` where ``codes`` holds
+    label codes (-1 = missing). Equivalent to ``build_annotation_matrix``
+    followed by encoding, but each column is factorized with one
+    ``np.unique`` call and no per-record objects or nested lists are built.
+    As there, the last label wins when an annotator labels an item twice.
+    """
+    if not item_ids:
+        return np.empty((0, 0), dtype=np.int32), 0, [], []
+
+    items, item_idx = np.unique(np.asarray(item_ids, dtype=str), return_inverse=True)
+    annotators, ann_idx = np.unique(np.asarray(annotator_ids, dtype=str), return_inverse=True)
+    label_values, label_idx = np.unique(np.asarray(labels, dtype=str), return_inverse=True)
+
+    # Keep only the last record per cell; repeated fancy-index writes have no
+    # guaranteed order.
+    cells = item_idx * len(annotators) + ann_idx
+    _, last_from_end = np.unique(cells[::-1], return_index=True)
+    keep = len(cells) - 1 - last_from_end
+
+    codes = np.full((len(items), len(annotators)), -1, dtype=np.int32)
+    codes[item_idx[keep], ann_idx[keep]] = label_idx[keep]
+    return codes, len(label_values), items.tolist(), annotators.tolist()
+
+
 def cohen_kappa(labels_a: list[str], labels_b: list[str]) -> float | None:
     """Compute Cohen's kappa for two aligned label lists."""
     if len(labels_a) != len(labels_b) or not labels_a:
@@ -54,28 +87,60 @@ def cohen_kappa(labels_a: list[str], labels_b: list[str]) -> float | None:
     return (observed - expected) / (1.0 - expected)
 
 
+def _encode_labels(matrix: list[list[str | None]]) -> tuple[np.ndarray, int]:
+    """Encode a label matrix as small ints (-1 = missing); returns (codes, label count).
+
+    Codes are gathered into one flat list and converted in a single
+    ``np.array`` call; assigning cells into an array one by one costs far more.
+    """
+    label_index: dict[str, int] = {}
+    encode = label_index.setdefault
+    width = len(matrix[0]) if matrix else 0
+    flat = [
+        -1 if label is None else encode(label, len(label_index))
+        for row in matrix
+        for label in row
+    ]
+    codes = np.array(flat, dtype=np.int32).reshape(len(matrix), width)
+    return codes, len(label_index)
+
+
 def average_pairwise_kappa(matrix: list[list[str | None]]) -> float | None:
     """Compute average pairwise Cohen's kappa across annotators."""
     if not matrix or not matrix[0]:
         return None
+    return average_pairwise_kappa_codes(*_encode_labels(matrix))
 
-    annotator_count = len(matrix[0])
+
+def average_pairwise_kappa_codes(codes: np.ndarray, label_count: int) -> float | None:
+    """Average pairwise Cohen's kappa over an integer-encoded matrix.
+
+    Each pair's kappa comes from a label x label contingency table built
+    with one ``np.bincount``.
+    """
+    if codes.size == 0:
+        return None
+
+    present = codes >= 0
+    annotator_count = codes.shape[1]
     kappas: list[float] = []
 
     for i in range(annotator_count):
         for j in range(i + 1, annotator_count):
-            labels_a = []
-            labels_b = []
-            for row in matrix:
-                a = row[i]
-                b = row[j]
-                if a is None or b is None:
-                    continue
-                labels_a.append(a)
-                labels_b.append(b)
-            kappa = cohen_kappa(labels_a, labels_b)
-            if kappa is not None:
-                kappas.append(kappa)
+            both = present[:, i] & present[:, j]
+            n = int(both.sum())
+            if n == 0:
+                continue
+            table = np.bincount(
+                codes[both, i] * label_count + codes[both, j],
+                minlength=label_count * label_count,
+            ).reshape(label_count, label_count)
+            observed = int(np.trace(table)) / n
+            expected = float(((table.sum(axis=1) / n) * (table.sum(axis=0) / n)).sum())
+            if expected >= 1.0:
+                kappas.append(1.0)
+            else:
+                kappas.append((observed - expected) / (1.0 - expected))
 
     if not kappas:
         return None
@@ -84,26 +149,41 @@ def average_pairwise_kappa(matrix: list[list[str | None]]) -> float | None:
 
 def krippendorff_alpha_nominal(matrix: list[list[str | None]]) -> float | None:
     """Compute Krippendorff's alpha for nominal labels."""
-    total_counts: Counter[str] = Counter()
-    total_n = 0
-    do_sum = 0.0
-
-    for row in matrix:
-        labels = [label for label in row if label is not None]
-        n_i = len(labels)
-        if n_i <= 1:
-            continue
-        counts = Counter(labels)
-        total_counts.update(counts)
-        total_n += n_i
-        disagree = sum(count * (n_i - count) for count in counts.values())
-        do_sum += disagree / (n_i - 1)
+    return krippendorff_alpha_nominal_codes(*_encode_labels(matrix))
+
+
+def krippendorff_alpha_nominal_codes(codes: np.ndarray, label_count: int) -> float | None:
+    """Krippendorff's alpha for nominal labels over an integer-encoded matrix.
 
+    Per-item label counts are built in one ``np.bincount`` instead of a
+    ``Counter`` per row.
+    """
+    if codes.size == 0:
+        return None
+
+    present = codes >= 0
+    n_per_item = present.sum(axis=1)
+    pairable = n_per_item > 1
+    codes, present, n_per_item = codes[pairable], present[pairable], n_per_item[pairable]
+
+    # counts[i, k] = how many annotators gave item i label k
+    rows = np.broadcast_to(np.arange(len(codes))[:, None], codes.shape)
+    counts = np.bincount(
+        rows[present] * label_count + codes[present],
+        minlength=len(codes) * label_count,
+    ).reshape(len(codes), label_count)
+
+    total_n = int(n_per_item.sum())
     if total_n <= 1:
         return None
 
+    disagree = (counts * (n_per_item[:, None] - counts)).sum(axis=1)
+    # Summed in row order in Python so the result matches the scalar formula exactly
+    do_sum = sum((disagree / (n_per_item - 1)).tolist())
     do = do_sum / total_n
-    de_num = sum(count * (total_n - count) for count in total_counts.values())
+
+    total_counts = counts.sum(axis=0)
+    de_num = int((total_counts * (total_n - total_counts)).sum())
     de = de_num / (total_n * (total_n - 1))
 
     if de == 0.0:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+import heapq
 import random
-from typing import Any
+from typing import Any, Iterable
 
 from src.models import Conversation, EvaluationResult
 
@@ -20,12 +21,16 @@ class ConversationSample:
 
 
 class SamplingStrategy:
-    """Base class for sampling strategies."""
+    """Base class for sampling strategies.
+
+    Strategies read ``conversations`` in a single pass, so it may be any
+    iterable (e.g. a generator streaming from storage).
+    """
     name: str = "base"
 
     def sample(
         self,
-        conversations: list[Conversation],
+        conversations: Iterable[Conversation],
         evaluations: list[EvaluationResult],
         limit: int,
         **kwargs: Any,
@@ -39,7 +44,7 @@ class EvaluationSampler(SamplingStrategy):
 
     def sample(
         self,
-        conversations: list[Conversation],
+        conversations: Iterable[Conversation],
         evaluations: list[EvaluationResult],
         limit: int,
         **kwargs: Any,
@@ -71,20 +76,33 @@ class RandomSampler(SamplingStrategy):
 
     def sample(
         self,
-        conversations: list[Conversation],
+        conversations: Iterable[Conversation],
         evaluations: list[EvaluationResult],
         limit: int,
         **kwargs: Any,
     ) -> list[ConversationSample]:
         seed = kwargs.get("seed")
         rng = random.Random(seed)
-        candidates = list(conversations)
-        rng.shuffle(candidates)
-
-        eval_map = {e.conversation_id: e for e in evaluations}
+        if limit <= 0:
+            return []
+
+        # Reservoir sampling: one pass with O(limit) memory instead of
+        # copying and shuffling every conversation
+        reservoir: list[Conversation] = []
+        for i, conv in enumerate(conversations):
+            if i < limit:
+                reservoir.append(conv)
+            else:
+                j = rng.randint(0, i)
+                if j < limit:
+                    reservoir[j] = conv
+        # The reservoir keeps early items in place; shuffle for a random order
+        rng.shuffle(reservoir)
+
+        eval_map = _evaluation_map(evaluations, kwargs)
         return [
             _sample_from_conversation(conv, eval_map.get(conv.conversation_id))
-            for conv in candidates[:limit]
+            for conv in reservoir
         ]
 
 
@@ -94,16 +112,17 @@ class RecentSampler(SamplingStrategy):
 
     def sample(
         self,
-        conversations: list[Conversation],
+        conversations: Iterable[Conversation],
         evaluations: list[EvaluationResult],
         limit: int,
         **kwargs: Any,
     ) -> list[ConversationSample]:
-        eval_map = {e.conversation_id: e for e in evaluations}
-        candidates = sorted(conversations, key=lambda c: c.created_at, reverse=True)
+        eval_map = _evaluation_map(evaluations, kwargs)
+        # Same order as a stable descending sort, but O(N log limit)
+        candidates = heapq.nlargest(limit, conversations, key=lambda c: c.created_at)
         return [
             _sample_from_conversation(conv, eval_map.get(conv.conversation_id))
-            for conv in candidates[:limit]
+            for conv in candidates
         ]
 
 
@@ -113,15 +132,18 @@ class ConfidenceSampler(SamplingStrategy):
 
     def sample(
         self,
-        conversations: list[Conversation],
+        conversations: Iterable[Conversation],
         evaluations: list[EvaluationResult],
         limit: int,
         **kwargs: Any,
     ) -> list[ConversationSample]:
         threshold = float(kwargs.get("threshold", 0.8)) # Default high threshold to catch anything below it
         
-        # 1. Filter evaluations with low confidence
-        low_conf_evals = []
+        conv_map = {c.conversation_id: c for c in conversations}
+        samples = []
+        
+        # Single pass in evaluation order: filter low confidence, map back to
+        # conversations, and stop as soon as enough samples are collected
         for e in evaluations:
             # Check aggregate confidence if available, or calculate average of sub-evaluators
             # Currently EvaluationResult doesn't store aggregate confidence, so we compute it
@@ -130,14 +152,9 @@ class ConfidenceSampler(SamplingStrategy):
                 continue
             
             avg_conf = sum(confs) / len(confs)
-            if avg_conf < threshold:
-                low_conf_evals.append(e)
-
-        # 2. Map back to conversations
-        conv_map = {c.conversation_id: c for c in conversations}
-        samples = []
-        
-        for e in low_conf_evals:
+            if avg_conf >= threshold:
+                continue
+            
             conv = conv_map.get(e.conversation_id)
             if conv:
                 samples.append(_sample_from_conversation(conv, e))
@@ -153,7 +170,7 @@ class MetadataSampler(SamplingStrategy):
 
     def sample(
         self,
-        conversations: list[Conversation],
+        conversations: Iterable[Conversation],
         evaluations: list[EvaluationResult],
         limit: int,
         **kwargs: Any,
@@ -164,7 +181,7 @@ class MetadataSampler(SamplingStrategy):
         if not key:
             raise ValueError("metadata_key is required for metadata sampling.")
 
-        eval_map = {e.conversation_id: e for e in evaluations}
+        eval_map = _evaluation_map(evaluations, kwargs)
         samples: list[ConversationSample] = []
 
         for conv in conversations:
@@ -195,12 +212,17 @@ def list_strategies() -> list[str]:
 
 def sample_conversations(
     strategy: str,
-    conversations: list[Conversation],
+    conversations: Iterable[Conversation],
     evaluations: list[EvaluationResult],
     limit: int,
     **kwargs: Any,
 ) -> list[ConversationSample]:
-    """Dispatch to the selected sampling strategy."""
+    """Dispatch to the selected sampling strategy.
+
+    Callers sampling repeatedly from the same evaluations can pass
+    ``eval_map=evaluations_by_conversation(evaluations)`` so the lookup
+    isn't rebuilt on every call.
+    """
     if strategy in ("evaluation", "confidence") and not evaluations:
         strategy = "random"
     
@@ -210,6 +232,24 @@ def sample_conversations(
     return sampler.sample(conversations, evaluations, limit, **kwargs)
 
 
+def evaluations_by_conversation(
+    evaluations: Iterable[EvaluationResult],
+) -> dict[str, EvaluationResult]:
+    """Index evaluations by conversation ID (the last one wins)."""
+    return {e.conversation_id: e for e in evaluations}
+
+
+def _evaluation_map(
+    evaluations: list[EvaluationResult],
+    kwargs: dict[str, Any],
+) -> dict[str, EvaluationResult]:
+    """Return the caller's precomputed ``eval_map`` or build one."""
+    eval_map = kwargs.get("eval_map")
+    if eval_map is None:
+        eval_map = evaluations_by_conversation(evaluations)
+    return eval_map
+
+
 def _sample_from_conversation(
     conversation: Conversation,
     evaluation: EvaluationResult | None,
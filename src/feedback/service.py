@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from collections import Counter
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
 from src.db.repository import ConversationRepository
 from src.models import FeedbackSignal, Conversation
 from src.feedback.metrics import (
-    AnnotationRecord,
-    build_annotation_matrix,
-    average_pairwise_kappa,
-    krippendorff_alpha_nominal,
+    build_encoded_matrix_from_columns,
+    average_pairwise_kappa_codes,
+    krippendorff_alpha_nominal_codes,
 )
 
+# Feedback sources that count as human judgements for disagreement checks
+HUMAN_SOURCES = frozenset({"user", "ops", "annotator"})
+
+
 class FeedbackService:
     """Service for managing feedback and resolving disagreements."""
 
@@ -27,77 +32,72 @@ class FeedbackService:
 
     def get_disagreements(self, limit: int = 50) -> list[dict[str, Any]]:
         """Identify conversations with conflicting human feedback."""
-        # This is a naive implementation scanning all conversations.
+        # Only human signals, streamed from the repository (which can filter
+        # them at the source) instead of scanning every conversation here.
         # In prod, we'd query a "needs_resolution" index.
-        conversations = self.repository.list_conversations(limit=1000) 
+        human_feedback = self.repository.iter_feedback(sources=HUMAN_SOURCES, limit=1000)
         disagreements = []
+        limit_reached = False
 
-        for conv in conversations:
-            if not conv.feedback:
-                continue
-            
-            # Group by signal (e.g. 'user_rating', 'helpfulness')
-            signals: dict[str, list[FeedbackSignal]] = {}
-            for f in conv.feedback:
-                if f.source in ("user", "ops", "annotator"): # Only human signals
-                    key = f.signal
-                    if key not in signals:
-                        signals[key] = []
-                    signals[key].append(f)
+        for conversation_id, feedback_rows in groupby(human_feedback, key=itemgetter(0)):
+            # Group stringified values by signal (e.g. 'user_rating', 'helpfulness')
+            signals: defaultdict[str, list[str]] = defaultdict(list)
+            for _, created_at, f in feedback_rows:
+                signals[f.signal].append(str(f.value))
             
             # Check for variance in any signal
-            for signal_name, items in signals.items():
-                if len(items) < 2:
+            for signal_name, values in signals.items():
+                if len(values) < 2:
                     continue
                 
-                values = [str(i.value) for i in items]
-                if len(set(values)) > 1:
+                # Any value differing from the first is a conflict; a C-level
+                # count instead of building a set per signal
+                if values.count(values[0]) != len(values):
                     disagreements.append({
-                        "conversation_id": conv.conversation_id,
+                        "conversation_id": conversation_id,
                         "signal": signal_name,
                         "values": values,
-                        "conflict_count": len(items),
-                        "created_at": conv.created_at
+                        "conflict_count": len(values),
+                        "created_at": created_at
                     })
                     if len(disagreements) >= limit:
+                        limit_reached = True
                         break
             
-            if len(disagreements) >= limit:
+            if limit_reached:
                 break
                 
         return disagreements
 
     def get_agreement_metrics(self, signal: str) -> dict[str, Any]:
         """Compute agreement metrics for a given signal across conversations."""
-        records: list[AnnotationRecord] = []
-        conversations = self.repository.list_conversations(limit=1000)
+        # Parallel columns rather than one record object per annotation
+        item_ids: list[str] = []
+        annotator_ids: list[str] = []
+        labels: list[str] = []
+        rows = self.repository.iter_feedback(signal=signal, feedback_types=("explicit",), limit=1000)
 
-        for conv in conversations:
-            for feedback in conv.feedback:
-                if feedback.signal != signal:
-                    continue
-                if feedback.feedback_type != "explicit":
-                    continue
-                if not feedback.annotator_id:
-                    continue
+        for conversation_id, _, feedback in rows:
+            if not feedback.annotator_id:
+                continue
 
-                item_id = conv.conversation_id
-                if feedback.turn_id is not None:
-                    item_id = f"{conv.conversation_id}:{feedback.turn_id}"
+            item_id = conversation_id
+            if feedback.turn_id is not None:
+                item_id = f"{conversation_id}:{feedback.turn_id}"
 
-                records.append(AnnotationRecord(
-                    item_id=item_id,
-                    annotator_id=feedback.annotator_id,
-                    label=str(feedback.value),
-                ))
+            item_ids.append(item_id)
+            annotator_ids.append(feedback.annotator_id)
+            labels.append(str(feedback.value))
 
-        matrix, items, annotators = build_annotation_matrix(records)
+        codes, label_count, items, annotators = build_encoded_matrix_from_columns(
+            item_ids, annotator_ids, labels
+        )
         return {
             "signal": signal,
             "items": len(items),
             "annotators": len(annotators),
-            "pairwise_kappa": average_pairwise_kappa(matrix),
-            "krippendorff_alpha": krippendorff_alpha_nominal(matrix),
+            "pairwise_kappa": average_pairwise_kappa_codes(codes, label_count),
+            "krippendorff_alpha": krippendorff_alpha_nominal_codes(codes, label_count),
         }
 
     def resolve_disagreement(self, conversation_id: str, signal: str, resolution_value: Any, resolver_id: str) -> None:
@@ -116,23 +116,22 @@ class FeedbackService:
 
     def get_consensus_label(self, conversation: Conversation, signal_name: str) -> Any | None:
         """Get the consensus value for a signal (simple majority vote)."""
-        relevant_feedback = [
-            f for f in conversation.feedback 
-            if f.signal == signal_name and f.feedback_type == "explicit"
-        ]
+        # One pass: an admin resolution wins outright, otherwise count votes
+        counts: dict[str, int] = {}
+        for f in conversation.feedback:
+            if f.signal != signal_name or f.feedback_type != "explicit":
+                continue
+            # 1. Check for admin resolution
+            if f.source == "admin_resolution":
+                return f.value
+            value = str(f.value)
+            counts[value] = counts.get(value, 0) + 1
         
-        if not relevant_feedback:
+        if not counts:
             return None
             
-        # 1. Check for admin resolution
-        admin_res = next((f for f in relevant_feedback if f.source == "admin_resolution"), None)
-        if admin_res:
-            return admin_res.value
-            
-        # 2. Majority vote
-        values = [str(f.value) for f in relevant_feedback]
-        counts = Counter(values)
-        most_common, count = counts.most_common(1)[0]
+        # 2. Majority vote (ties go to the value seen first)
+        most_common, count = max(counts.items(), key=itemgetter(1))
         
         # If tie or weak consensus, we could return None or a specific flag
         # For this prototype, we return the most common
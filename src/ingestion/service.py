@@ -10,23 +10,140 @@ Usage:
     result = service.ingest_batch(conversations_json)
 """
 
+import errno
 import json
+import mmap
+import os
 import uuid
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 from pydantic import ValidationError as PydanticValidationError
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; large files are then parsed in one go
+    ijson = None
+
 from src.models import (
     Conversation,
     Turn,
     ToolCall,
-    Role,
+    _CANONICAL_ROLES,
     IngestionResult,
+    utc_now,
 )
 from src.db.repository import ConversationRepository
+from src.config import get_settings
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Parse a JSON document, with orjson when installed.
+
+    Anything orjson rejects (e.g. NaN literals, integers beyond 64 bits) is
+    re-parsed with the stdlib, so the accepted input and the errors raised
+    (``json.JSONDecodeError``) are unchanged.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping it for orjson when installed.
+
+    orjson then parses straight from the page cache, without first copying
+    the whole file into a bytes object.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:  # empty files can't be mapped
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    try:
+                        return orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        pass  # let the stdlib accept or report it, as in _load_json_bytes
+        return json.loads(path.read_bytes())
+    return _load_json_bytes(path.read_bytes())
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """Move a file with one atomic rename.
+
+    Source and destination directories (pending/, processed/, error/ and
+    the pipeline's source and processed dirs) are expected to be on one
+    filesystem; only if they aren't does this fall back to ``shutil.move``
+    (copy and delete).
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+# Parse errors from either parser
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
+
+# Files larger than this are parsed incrementally when ijson is installed
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def _stream_prefix(f: BinaryIO) -> str | None:
+    """Return the ijson prefix of the conversations in a JSON file, if streamable.
+
+    Handles a top-level array and a ``{"conversations": [...]}`` wrapper whose
+    first key is ``conversations``; anything else returns None and is loaded
+    whole. Rewinds ``f``.
+    """
+    prefix = None
+    for path, event, value in ijson.parse(f):
+        if path == "" and event == "start_array":
+            prefix = "item"
+        elif path == "" and event == "map_key" and value == "conversations":
+            prefix = "conversations.item"
+        elif path == "" and event == "start_map":
+            continue
+        break
+    f.seek(0)
+    return prefix
+
+
+def _parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp.
+
+    ``fromisoformat`` (C-implemented) accepts a trailing "Z" itself, so the
+    string is only rewritten for the rare forms it rejects, keeping exactly
+    the inputs the old ``replace("Z", "+00:00")`` path accepted.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _uuid4_strings(batch: int = 256) -> Iterator[str]:
+    """Yield random (version 4) UUID strings, reading randomness ``batch`` at a time.
+
+    Same format as ``str(uuid.uuid4())``, but one ``os.urandom`` call
+    covers ``batch`` IDs.
+    """
+    while True:
+        pool = os.urandom(16 * batch)
+        for start in range(0, len(pool), 16):
+            yield str(uuid.UUID(bytes=pool[start:start + 16], version=4))
 
 
 class ValidationError(Exception):
@@ -59,39 +176,61 @@ class IngestionService:
         Raises:
             ValidationError: If validation fails
         """
+        # Validation already raises ValidationError; let it through unwrapped
+        conversation = self._validate_and_convert(conversation_data)
         try:
-            conversation = self._validate_and_convert(conversation_data)
             conversation_id = self.repository.save_conversation(conversation)
-            conversation.conversation_id = conversation_id
-            return conversation
         except Exception as e:
-            raise ValidationError(f"Failed to ingest conversation: {str(e)}")
+            raise ValidationError(f"Failed to ingest conversation: {str(e)}") from e
+        conversation.conversation_id = conversation_id
+        return conversation
     
-    def ingest_batch(self, conversations: list[dict[str, Any]]) -> IngestionResult:
+    def ingest_batch(self, conversations: Iterable[dict[str, Any]]) -> IngestionResult:
         """Ingest multiple conversations.
         
         Args:
-            conversations: List of raw conversation dictionaries
+            conversations: Raw conversation dictionaries; any iterable, so a
+                streaming parser can feed them without building a list
             
         Returns:
             IngestionResult with success/failure counts
         """
-        success_count = 0
         failed_count = 0
         errors = []
-        conversation_ids = []
         
+        # Validate everything first (no I/O), then save the valid ones in
+        # one repository call
+        valid: list[Conversation] = []
+        now = utc_now()
+        new_id = _uuid4_strings().__next__
+        total = 0
         for conv_data in conversations:
+            total += 1
             try:
-                conversation = self.ingest_single(conv_data)
-                success_count += 1
-                conversation_ids.append(conversation.conversation_id)
-            except ValidationError as e:
+                valid.append(self._validate_and_convert(conv_data, now, new_id))
+            except Exception as e:
                 failed_count += 1
-                errors.append(str(e))
+                errors.append(f"Failed to ingest conversation: {str(e)}")
+        
+        try:
+            conversation_ids = self.repository.save_conversations(valid)
+        except Exception:
+            # Save one by one so failures are attributed to their conversation
+            saved, conversation_ids = [], []
+            for conversation in valid:
+                try:
+                    conversation_ids.append(self.repository.save_conversation(conversation))
+                    saved.append(conversation)
+                except Exception as e:
+                    failed_count += 1
+                    errors.append(f"Failed to ingest conversation: {str(e)}")
+            valid = saved
+        for conversation, conversation_id in zip(valid, conversation_ids):
+            conversation.conversation_id = conversation_id
+        success_count = len(conversation_ids)
         
         return IngestionResult(
-            total=len(conversations),
+            total=total,
             success=success_count,
             failed=failed_count,
             errors=errors,
@@ -99,10 +238,20 @@ class IngestionService:
         )
     
     def ingest_from_file(self, file_path: str | Path) -> IngestionResult:
-        """Ingest conversations from a JSON file."""
+        """Ingest conversations from a JSON file.
+        
+        Files over ``STREAM_THRESHOLD_BYTES`` are parsed one conversation at a
+        time when ijson is installed, so the raw document is never held in
+        memory at once.
+        """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            if ijson is not None and Path(file_path).stat().st_size > STREAM_THRESHOLD_BYTES:
+                with open(file_path, "rb") as f:
+                    prefix = _stream_prefix(f)
+                    if prefix is not None:
+                        return self.ingest_batch(ijson.items(f, prefix, use_float=True))
+            
+            data = _load_json_file(Path(file_path))
             
             # Handle various JSON structures
             if isinstance(data, dict):
@@ -118,7 +267,7 @@ class IngestionService:
                 raise ValidationError(f"Invalid JSON structure in {file_path}")
             
             return self.ingest_batch(conversations)
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             raise ValidationError(f"Invalid JSON in {file_path}: {str(e)}")
         except ValidationError:
             raise
@@ -151,17 +300,30 @@ class IngestionService:
             "details": []
         }
         
-        # Process each JSON file
-        for file_path in pending_path.glob("*.json"):
+        # Read, parse and save files concurrently; results come back in file
+        # order and are recorded (and files moved) here on one thread
+        # scandir + a suffix check; Paths are only built for matching files
+        with os.scandir(pending_path) as entries:
+            files = [
+                pending_path / entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        workers = min(len(files), get_settings().max_workers) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(self._try_ingest_file, files))
+        
+        for file_path, ingest_result in zip(files, outcomes):
             results["files_processed"] += 1
             try:
-                ingest_result = self.ingest_from_file(file_path)
+                if isinstance(ingest_result, Exception):
+                    raise ingest_result
                 results["total_conversations"] += ingest_result.total
                 results["success_count"] += ingest_result.success
                 results["failed_count"] += ingest_result.failed
                 
                 # Move to processed
-                shutil.move(str(file_path), str(processed_dir / file_path.name))
+                _move_file(file_path, processed_dir / file_path.name)
                 results["details"].append({
                     "file": file_path.name,
                     "status": "success",
@@ -169,7 +331,7 @@ class IngestionService:
                 })
             except Exception as e:
                 # Move to error
-                shutil.move(str(file_path), str(error_dir / file_path.name))
+                _move_file(file_path, error_dir / file_path.name)
                 results["details"].append({
                     "file": file_path.name,
                     "status": "error",
@@ -178,11 +340,27 @@ class IngestionService:
         
         return results
     
-    def _validate_and_convert(self, data: dict[str, Any]) -> Conversation:
+    def _try_ingest_file(self, file_path: Path) -> IngestionResult | Exception:
+        """Ingest a file, returning (not raising) any error for the caller to record."""
+        try:
+            return self.ingest_from_file(file_path)
+        except Exception as e:
+            return e
+    
+    def _validate_and_convert(
+        self,
+        data: dict[str, Any],
+        now: datetime | None = None,
+        new_id: Callable[[], str] | None = None,
+    ) -> Conversation:
         """Validate and convert raw data to Conversation model.
         
         Args:
             data: Raw conversation dictionary
+            now: Ingestion time to record as ``created_at`` (defaults to the
+                current time); a batch passes one shared instant
+            new_id: Source of IDs for conversations without one (defaults
+                to ``uuid4``); a batch passes a pooled generator
             
         Returns:
             Validated Conversation object
@@ -192,7 +370,7 @@ class IngestionService:
         """
         try:
             # Generate conversation_id if not provided
-            conversation_id = data.get("conversation_id") or str(uuid.uuid4())
+            conversation_id = data.get("conversation_id") or (new_id() if new_id else str(uuid.uuid4()))
             
             # Parse turns
             turns_data = data.get("turns", [])
@@ -201,48 +379,52 @@ class IngestionService:
             
             turns = []
             for idx, turn_data in enumerate(turns_data):
+                get = turn_data.get  # bound once; looked up for every field below
+                
                 # Assign turn_id if not provided
-                turn_id = turn_data.get("turn_id", idx)
+                turn_id = get("turn_id", idx)
                 
                 # Parse role
-                role_str = turn_data.get("role", "").lower()
-                try:
-                    role = Role(role_str)
-                except ValueError:
-                    raise ValidationError(f"Invalid role '{role_str}' in turn {turn_id}")
+                # Roles are almost always already lowercase; only lower() on a miss
+                raw_role = get("role", "")
+                role = _CANONICAL_ROLES.get(raw_role) if type(raw_role) is str else None
+                if role is None:
+                    role_str = raw_role.lower()
+                    role = _CANONICAL_ROLES.get(role_str)
+                    if role is None:
+                        raise ValidationError(f"Invalid role '{role_str}' in turn {turn_id}")
                 
                 # Parse content
-                content = turn_data.get("content", "")
+                content = get("content", "")
                 
                 # Parse timestamp
                 timestamp = None
-                if "timestamp" in turn_data:
-                    ts = turn_data["timestamp"]
+                if (ts := get("timestamp")) is not None:
                     if isinstance(ts, str):
                         try:
-                            timestamp = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                            timestamp = _parse_iso_timestamp(ts)
                         except ValueError:
                             raise ValidationError(f"Invalid timestamp format in turn {turn_id}")
                     elif isinstance(ts, datetime):
                         timestamp = ts
                 
                 # Parse tool calls
-                tool_calls = []
-                for tc_data in turn_data.get("tool_calls", []):
-                    tool_call = ToolCall(
+                tool_calls = tuple(
+                    ToolCall(
                         tool_name=tc_data.get("tool_name", ""),
                         parameters=tc_data.get("parameters", {}),
                         result=tc_data.get("result"),
                         execution_time_ms=tc_data.get("execution_time_ms"),
                     )
-                    tool_calls.append(tool_call)
+                    for tc_data in get("tool_calls", ())
+                )
                 
                 turn = Turn(
                     turn_id=turn_id,
                     role=role,
                     content=content,
                     timestamp=timestamp,
-                    latency_ms=turn_data.get("latency_ms"),
+                    latency_ms=get("latency_ms"),
                     tool_calls=tool_calls,
                 )
                 turns.append(turn)
@@ -250,9 +432,9 @@ class IngestionService:
             # Create conversation
             conversation = Conversation(
                 conversation_id=conversation_id,
-                turns=turns,
+                turns=tuple(turns),
                 metadata=data.get("metadata", {}),
-                created_at=datetime.utcnow(),
+                created_at=now or utc_now(),
             )
             
             return conversation
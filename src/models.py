@@ -2,36 +2,70 @@
 
 This module defines all dataclasses used throughout the pipeline:
 - Conversation, Turn, ToolCall: Input data structures
+- TurnColumns, TurnArrays: Column-oriented views of a conversation's turns
 - EvaluatorResult, Issue, EvaluationResult: Output data structures
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Literal
-from enum import Enum
+from itertools import chain
+import hashlib
+import pickle
 import uuid
 
+import numpy as np
+
+
+_UTC = timezone.utc
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(_UTC)
+
+
+def parse_utc_timestamp(value: Any) -> datetime | None:
+    """Parse an ISO-8601 timestamp, treating naive values as UTC.
+
+    Returns None if ``value`` is absent or malformed. Older data and
+    clients send naive UTC times; reading them as UTC keeps them
+    comparable with the timezone-aware values produced by ``utc_now``.
+    """
+    # Anything shorter than YYYY-MM-DD cannot be a valid timestamp
+    if not isinstance(value, str) or len(value) < 10:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=_UTC)
+
 
 # =============================================================================
-# Enums
+# Constants
 # =============================================================================
+# Plain string constants rather than Enums: values compare, hash and
+# serialize as ordinary strings, with no Enum lookup on construction.
 
-class Role(str, Enum):
+class Role:
     """Role in a conversation turn."""
     USER = "user"
     ASSISTANT = "assistant"
     SYSTEM = "system"
+    _VALID = frozenset({USER, ASSISTANT, SYSTEM})
 
 
-class IssueSeverity(str, Enum):
+class IssueSeverity:
     """Severity level for detected issues."""
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
+    _VALID = frozenset({LOW, MEDIUM, HIGH, CRITICAL})
 
 
-class IssueType(str, Enum):
+class IssueType:
     """Types of issues that can be detected."""
     # Heuristic issues
     MISSING_FIELD = "missing_field"
@@ -54,27 +88,40 @@ class IssueType(str, Enum):
     LOW_HELPFULNESS = "low_helpfulness"
     LOW_FACTUALITY = "low_factuality"
     LOW_QUALITY = "low_quality"
+    
+    _VALID = frozenset({
+        MISSING_FIELD, FORMAT_ERROR, LATENCY_EXCEEDED,
+        INVALID_TOOL, INVALID_PARAM, MISSING_PARAM, TOOL_HALLUCINATION, EXECUTION_FAILED,
+        CONTEXT_LOSS, INCONSISTENT_RESPONSE, REFERENCE_ERROR,
+        LOW_HELPFULNESS, LOW_FACTUALITY, LOW_QUALITY,
+    })
+
+
+# Canonical role strings by value, so every Turn shares the same string
+# objects and roles can still be compared by identity; a dict miss means an
+# unknown role (ingestion validates raw roles against this table too).
+_CANONICAL_ROLES = {role: role for role in Role._VALID}
 
 
 # =============================================================================
 # Input Data Structures
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackSignal:
     """Represents a single feedback signal for a conversation or turn."""
     feedback_type: Literal["explicit", "implicit"] = "explicit"
     signal: str = ""
     value: Any = None
     source: str = ""
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
     turn_id: int | None = None
     annotator_id: str | None = None
     confidence: float | None = None
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool/function call made by the assistant.
     
@@ -90,7 +137,7 @@ class ToolCall:
     execution_time_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """Represents a single turn in a conversation.
     
@@ -103,19 +150,90 @@ class Turn:
         latency_ms: Response latency in milliseconds (assistant only)
     """
     turn_id: int
-    role: Role
+    role: str
     content: str
     timestamp: datetime | None = None
     tool_calls: tuple[ToolCall, ...] | list[ToolCall] = field(default_factory=tuple)
     latency_ms: float | None = None
+    # Derived once here so hot loops read plain attributes
+    _is_assistant: bool = field(default=False, init=False, repr=False, compare=False)
+    _content_len: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        # Normalize role to the canonical constant so it can be compared by identity
+        role = _CANONICAL_ROLES.get(self.role) if type(self.role) is str else None
+        if role is None:
+            raise ValueError(f"{self.role!r} is not a valid Role")
+        self.role = role
+        self._is_assistant = self.role is Role.ASSISTANT
+        self._content_len = len(self.content)
         # Normalize tool_calls to tuple
         if isinstance(self.tool_calls, list):
             self.tool_calls = tuple(self.tool_calls)
 
 
-@dataclass
+@dataclass(slots=True)
+class TurnColumns:
+    """Column-oriented (struct-of-arrays) view of a conversation's turns.
+    
+    Every list is aligned with ``Conversation.turns`` so bulk consumers
+    (serialization, analytics) can ``zip`` over plain lists instead of
+    reading attributes off each Turn object.
+    """
+    turn_ids: list[int]
+    roles: list[str]
+    contents: list[str]
+    timestamps: list[datetime | None]
+    latency_ms: list[float | None]
+    tool_calls: list[tuple[ToolCall, ...]]
+    
+    @classmethod
+    def from_turns(cls, turns: tuple[Turn, ...] | list[Turn]) -> "TurnColumns":
+        """Build the columns in a single pass over the turns."""
+        columns = cls([], [], [], [], [], [])
+        for turn in turns:
+            columns.turn_ids.append(turn.turn_id)
+            columns.roles.append(turn.role)
+            columns.contents.append(turn.content)
+            columns.timestamps.append(turn.timestamp)
+            columns.latency_ms.append(turn.latency_ms)
+            columns.tool_calls.append(turn.tool_calls)
+        return columns
+
+
+@dataclass(slots=True)
+class TurnArrays:
+    """Contiguous NumPy arrays of the numeric per-turn fields.
+    
+    Aligned with ``Conversation.turns`` like ``TurnColumns``; lets threshold
+    checks run as vectorized comparisons. Missing latencies are NaN, so they
+    never compare greater than a threshold.
+    """
+    content_lengths: np.ndarray
+    is_blank: np.ndarray  # empty or whitespace-only content
+    is_assistant: np.ndarray
+    latency_ms: np.ndarray
+    
+    @classmethod
+    def from_columns(cls, columns: TurnColumns) -> "TurnArrays":
+        n = len(columns.contents)
+        return cls(
+            content_lengths=np.fromiter(map(len, columns.contents), dtype=np.int64, count=n),
+            is_blank=np.fromiter(
+                (not content.strip() for content in columns.contents), dtype=np.bool_, count=n
+            ),
+            is_assistant=np.fromiter(
+                (role is Role.ASSISTANT for role in columns.roles), dtype=np.bool_, count=n
+            ),
+            latency_ms=np.fromiter(
+                (np.nan if latency is None else latency for latency in columns.latency_ms),
+                dtype=np.float64,
+                count=n,
+            ),
+        )
+
+
+@dataclass(slots=True)
 class Conversation:
     """Represents a complete multi-turn conversation.
     
@@ -129,7 +247,12 @@ class Conversation:
     turns: tuple[Turn, ...] | list[Turn]
     feedback: tuple[FeedbackSignal, ...] | list[FeedbackSignal] = field(default_factory=tuple)
     metadata: dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
+    _columns: TurnColumns | None = field(default=None, init=False, repr=False, compare=False)
+    _columns_turns: tuple[Turn, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _arrays: TurnArrays | None = field(default=None, init=False, repr=False, compare=False)
+    _digest: str | None = field(default=None, init=False, repr=False, compare=False)
+    _digest_source: tuple[Any, ...] | None = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         # Generate ID if not provided
@@ -141,13 +264,46 @@ class Conversation:
         # Normalize feedback to tuple
         if isinstance(self.feedback, list):
             self.feedback = tuple(self.feedback)
+    
+    def turn_columns(self) -> TurnColumns:
+        """Return the struct-of-arrays view of ``turns``, cached until turns change."""
+        if self._columns is None or self._columns_turns is not self.turns:
+            self._columns = TurnColumns.from_turns(self.turns)
+            self._columns_turns = self.turns
+            self._arrays = None
+        return self._columns
+    
+    def turn_arrays(self) -> TurnArrays:
+        """Return NumPy arrays of turn lengths, blankness, roles and latencies, cached like ``turn_columns``."""
+        columns = self.turn_columns()
+        if self._arrays is None:
+            self._arrays = TurnArrays.from_columns(columns)
+        return self._arrays
+    
+    def content_digest(self) -> str | None:
+        """Digest of the ID, turns and metadata, for result-cache keys.
+        
+        Computed once and shared by every evaluator; recomputed when any of
+        the three is replaced (in-place edits aren't tracked, as with
+        ``turn_columns``). None if the content can't be pickled.
+        """
+        source = (self.conversation_id, self.turns, self.metadata)
+        cached = self._digest_source
+        if cached is None or any(a is not b for a, b in zip(source, cached)):
+            try:
+                payload = pickle.dumps(source, protocol=5)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                return None
+            self._digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            self._digest_source = source
+        return self._digest
 
 
 # =============================================================================
 # Output Data Structures
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     """Represents a detected issue in a conversation.
     
@@ -159,15 +315,15 @@ class Issue:
         details: Additional details about the issue
         suggested_fix: Suggested remediation (if applicable)
     """
-    issue_type: IssueType
-    severity: IssueSeverity
+    issue_type: str
+    severity: str
     description: str
     turn_id: int | None = None
     details: dict[str, Any] = field(default_factory=dict)
     suggested_fix: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluatorResult:
     """Result from a single evaluator.
     
@@ -187,7 +343,7 @@ class EvaluatorResult:
     latency_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Complete evaluation result for a conversation.
     
@@ -206,21 +362,21 @@ class EvaluationResult:
     aggregate_score: float = 0.0
     issues: list[Issue] = field(default_factory=list)
     status: Literal["pending", "completed", "failed"] = "pending"
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
     
     def compute_aggregate_score(self) -> float:
         """Compute aggregate score from individual evaluator scores."""
         if not self.evaluations:
             return 0.0
         
-        all_scores = []
-        for eval_result in self.evaluations.values():
-            all_scores.extend(eval_result.scores.values())
-        
-        if not all_scores:
+        # Sum in C over the chained score views instead of copying them into a
+        # list first; the summation order (and so the result) is unchanged
+        score_views = [eval_result.scores.values() for eval_result in self.evaluations.values()]
+        count = sum(map(len, score_views))
+        if not count:
             return 0.0
         
-        self.aggregate_score = sum(all_scores) / len(all_scores)
+        self.aggregate_score = sum(chain.from_iterable(score_views)) / count
         return self.aggregate_score
     
     def aggregate_issues(self) -> list[Issue]:
@@ -236,7 +392,7 @@ class EvaluationResult:
 # Ingestion Result
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class IngestionResult:
     """Result from ingesting conversations.
     
@@ -1,15 +1,78 @@
 from __future__ import annotations
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+from itertools import islice
 from pathlib import Path
 import json
-from typing import Any, Dict, List
-
+import os
+import queue
+import re
+import threading
+from typing import Any, Callable, Dict, List
+
+try:
+    import ijson
+except ImportError:  # optional; large files are then parsed in one go
+    ijson = None
+
+from src.config import get_settings
 from src.db.repository import ConversationRepository, get_repository
 from src.evaluation.evaluators import get_global_registry, EvaluatorDiscovery
+from src.evaluation.evaluators.tool_call import ACTIVE_SCHEMA_PATH
 from src.evaluation.service import EvaluationService
-from src.ingestion.service import IngestionService, ValidationError
+from src.ingestion.service import (
+    STREAM_THRESHOLD_BYTES,
+    IngestionService,
+    ValidationError,
+    _load_json_file,
+    _stream_prefix,
+)
 from src.analysis.service import AnalysisService
+from src.models import IngestionResult, utc_now
+
+# Progress lines are buffered and printed this many at a time
+PROGRESS_FLUSH_EVERY = 50
+
+
+def _read_json(path: Path, limit: int | None = None) -> Any:
+    """Parse one source file with the ingestion service's JSON loader.
+    
+    A top-level array larger than ``STREAM_THRESHOLD_BYTES`` is streamed with
+    ijson when installed, stopping after ``limit`` items, so the raw file is
+    never held in memory.
+    """
+    if ijson is not None and path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        with path.open("rb") as f:
+            if _stream_prefix(f) == "item":
+                return list(islice(ijson.items(f, "item", use_float=True), limit))
+    return _load_json_file(path)
+
+
+def _list_source_files(directory: Path, pattern: str) -> List[Path]:
+    """List files in ``directory`` matching a glob ``pattern``.
+
+    Plain name patterns are matched against one ``os.scandir`` listing, so
+    Paths are only built for matches; patterns spanning directories (a
+    separator or ``**``) go through ``Path.glob``.
+    """
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        return list(directory.glob(pattern))
+    match = re.compile(fnmatch.translate(pattern), re.IGNORECASE if os.name == "nt" else 0).match
+    try:
+        with os.scandir(directory) as entries:
+            return [directory / entry.name for entry in entries if match(entry.name) and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _latest_per_conversation(evaluations: List[Any]) -> List[Any]:
+    """Keep each conversation's last (highest-stage) evaluation.
+
+    Conversations keep the order of their first evaluation; built with one
+    dict comprehension, since later stages override earlier ones on insert.
+    """
+    return list({e.conversation_id: e for e in evaluations}.values())
 
 
 class BatchPipelineProcessor:
@@ -33,15 +96,21 @@ class BatchPipelineProcessor:
         self,
         repository: ConversationRepository | None = None,
         source_dir: str | Path = "data/travel_agent",
+        cache_dir: str | Path = "data/.pipeline_cache",
     ):
         """Initialize the batch processor.
 
         Args:
             repository: Optional repository instance
             source_dir: Directory containing conversation files
+            cache_dir: Where incremental runs keep their file manifest
         """
         self.repository = repository or get_repository(data_dir="./data")
-        self.source_dir = Path(source_dir)
+        # Made absolute once here; loads list it and report it as-is
+        self.source_dir = Path(source_dir).absolute()
+        self._manifest_path = Path(cache_dir) / "manifest.json"
+        # path -> {"mtime_ns", "size", "ids"} of files already ingested; loaded lazily
+        self._manifest: Dict[str, Dict[str, Any]] | None = None
 
         # Initialize services
         registry = get_global_registry()
@@ -53,6 +122,12 @@ class BatchPipelineProcessor:
         self.evaluation_service = EvaluationService(self.repository, registry)
         self.analysis_service = AnalysisService(self.repository, self.evaluation_service)
 
+        # Stage services by evaluator list, reused across runs so their
+        # strategies are only resolved once (and again when the active tool
+        # schema they were built from changes)
+        self._stage_services: Dict[tuple[str, ...], EvaluationService] = {}
+        self._schema_stamp = self._active_schema_stamp()
+
         # Default evaluation stages
         self.default_stages = [
             {
@@ -69,11 +144,17 @@ class BatchPipelineProcessor:
             }
         ]
 
+    def close(self) -> None:
+        """Release the evaluation services' worker processes."""
+        for service in (self.evaluation_service, *self._stage_services.values()):
+            service.close()
+
     def run_batch_analysis(
         self,
         source_pattern: str = "*.json",
         custom_stages: List[Dict[str, Any]] | None = None,
         max_conversations: int | None = None,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
         """Run complete batch analysis with staged evaluation.
 
@@ -81,6 +162,11 @@ class BatchPipelineProcessor:
             source_pattern: Glob pattern for conversation files
             custom_stages: Optional custom evaluation stages
             max_conversations: Optional limit on conversations to process
+            incremental: Skip reading and re-ingesting files unchanged (same
+                mtime and size) since a previous incremental run, as long as
+                the repository still holds their conversations. Those
+                conversations are still evaluated, but appear in the returned
+                ``conversations`` as ``{"conversation_id": ...}`` only.
 
         Returns:
             Complete analysis results with all stages
@@ -88,14 +174,15 @@ class BatchPipelineProcessor:
         print("🚀 Starting Batch Analysis Pipeline")
         print("=" * 50)
 
-        # Stage 1: Load conversations
-        conversations = self._load_conversations(source_pattern, max_conversations)
+        # Stages 1-2: Load conversations, ingesting them while files are still being read
+        conversations, ingestion_result = self._load_and_ingest(
+            source_pattern, max_conversations, incremental=incremental
+        )
+        if incremental:
+            self._save_manifest()
         if not conversations:
             return {"error": "No conversations loaded"}
 
-        # Stage 2: Ingest conversations
-        ingestion_result = self._ingest_conversations(conversations)
-
         # Stage 3: Staged evaluation
         stages = custom_stages or self.default_stages
         evaluation_results = self._run_staged_evaluation(conversations, stages)
@@ -103,19 +190,11 @@ class BatchPipelineProcessor:
         # Stage 4: Analysis
         analysis_results = self._run_analysis(len(conversations))
 
-        # Stage 5: Summary
-        summary = self._generate_summary(conversations, evaluation_results, analysis_results)
-
         # Use only final stage evaluations for summary (most comprehensive)
-        final_stage_evaluations = []
-        if evaluation_results:
-            # Group evaluations by conversation_id and take the latest (highest stage)
-            eval_by_conv = {}
-            for eval_result in evaluation_results:
-                conv_id = eval_result.conversation_id
-                eval_by_conv[conv_id] = eval_result  # Later stages override earlier ones
+        final_stage_evaluations = _latest_per_conversation(evaluation_results)
 
-            final_stage_evaluations = list(eval_by_conv.values())
+        # Stage 5: Summary
+        summary = self._generate_summary(conversations, final_stage_evaluations, analysis_results)
 
         return {
             "conversations": conversations,
@@ -130,15 +209,22 @@ class BatchPipelineProcessor:
     def _load_conversations(
         self,
         source_pattern: str,
-        max_conversations: int | None = None
+        max_conversations: int | None = None,
+        sink: Callable[[List[Dict[str, Any]]], None] | None = None,
+        incremental: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Load conversations from files matching the pattern."""
+        """Load conversations from files matching the pattern.
+
+        If ``sink`` is given, each file's conversations are also passed to it
+        as soon as that file is parsed. With ``incremental``, unchanged files
+        are not read (see ``run_batch_analysis``) nor passed to ``sink``.
+        """
         print("\n📁 Stage 1: Loading Conversations")
 
-        source_path = Path(self.source_dir)
-        print(f"   Looking in directory: {source_path.absolute()}")
+        source_path = self.source_dir
+        print(f"   Looking in directory: {source_path}")
         print(f"   Using pattern: {source_pattern}")
-        source_files = list(source_path.glob(source_pattern))
+        source_files = _list_source_files(source_path, source_pattern)
 
         if not source_files:
             print(f"❌ No files found matching pattern: {source_pattern}")
@@ -147,44 +233,179 @@ class BatchPipelineProcessor:
         print(f"📖 Found {len(source_files)} files matching '{source_pattern}'")
 
         conversations = []
-        for i, file_path in enumerate(source_files, 1):
-            try:
-                data = json.loads(file_path.read_text())
-
-                if isinstance(data, list):
+        # Per-file progress lines, written in blocks of PROGRESS_FLUSH_EVERY
+        progress: List[str] = []
+        # Read and parse files concurrently; results are consumed in file order
+        # and anything still queued is cancelled once the limit is reached.
+        # Stat before reading, so a file modified mid-read is re-read next time
+        stats = [file_path.stat() for file_path in source_files] if incremental else None
+        workers = min(len(source_files), get_settings().max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for j, file_path in enumerate(source_files):
+                unchanged = self._unchanged_ids(file_path, stats[j]) if incremental else None
+                if unchanged is not None:
+                    futures.append(unchanged)
+                else:
+                    futures.append(pool.submit(_read_json, file_path, max_conversations))
+            for i, (file_path, future) in enumerate(zip(source_files, futures), 1):
+                if isinstance(future, list):
+                    data = [{"conversation_id": cid} for cid in future]
+                    progress.append(f"   {i:2d}/{len(source_files)} ⏭️ {file_path.name:<25} → {len(data)} conversations (unchanged)")
+                    if max_conversations:
+                        data = data[:max_conversations - len(conversations)]
                     conversations.extend(data)
-                    print(f"   {i:2d}/{len(source_files)} ✅ {file_path.name:<25} → {len(data)} conversations")
+                    if max_conversations and len(conversations) >= max_conversations:
+                        progress.append(f"   ⚠️ Reached max_conversations limit ({max_conversations})")
+                        pool.shutdown(cancel_futures=True)
+                        break
+                    continue
+
+                try:
+                    data = future.result()
+                except Exception as e:
+                    progress.append(f"   {i:2d}/{len(source_files)} ❌ {file_path.name:<25} → ERROR: {str(e)[:40]}")
+                    continue
+
+                # A read that hit the limit may have stopped early (streamed
+                # files), so only files known to be read in full are recorded
+                complete = not (max_conversations and isinstance(data, list) and len(data) >= max_conversations)
+                if incremental and complete:
+                    self._record_file(file_path, stats[i - 1], data)
+                if isinstance(data, list):
+                    progress.append(f"   {i:2d}/{len(source_files)} ✅ {file_path.name:<25} → {len(data)} conversations")
                 else:
-                    conversations.append(data)
-                    print(f"   {i:2d}/{len(source_files)} ✅ {file_path.name:<25} → 1 conversation")
+                    data = [data]
+                    progress.append(f"   {i:2d}/{len(source_files)} ✅ {file_path.name:<25} → 1 conversation")
+
+                # Apply the limit before anything is handed on
+                if max_conversations:
+                    data = data[:max_conversations - len(conversations)]
+                conversations.extend(data)
+                if sink is not None and data:
+                    sink(data)
 
                 # Check limit
                 if max_conversations and len(conversations) >= max_conversations:
-                    print(f"   ⚠️ Reached max_conversations limit ({max_conversations})")
+                    progress.append(f"   ⚠️ Reached max_conversations limit ({max_conversations})")
+                    pool.shutdown(cancel_futures=True)
                     break
 
-            except Exception as e:
-                print(f"   {i:2d}/{len(source_files)} ❌ {file_path.name:<25} → ERROR: {str(e)[:40]}")
-                continue
-
-        # Apply final limit if specified
-        if max_conversations and len(conversations) > max_conversations:
-            conversations = conversations[:max_conversations]
+                if len(progress) >= PROGRESS_FLUSH_EVERY:
+                    print("\n".join(progress))
+                    progress.clear()
 
+        if progress:
+            print("\n".join(progress))
         print(f"📥 Loaded {len(conversations)} conversations total")
         return conversations
 
-    def _ingest_conversations(self, conversations: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Ingest conversations into the database."""
-        print("\n🔄 Stage 2: Ingesting Conversations")
-
+    def _unchanged_ids(self, path: Path, stat: os.stat_result) -> List[str] | None:
+        """Conversation IDs of ``path`` if it is unchanged and already ingested, else None."""
+        if self._manifest is None:
+            self._manifest = self._read_manifest()
+        entry = self._manifest.get(str(path))
+        if not isinstance(entry, dict) or entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            return None
+        ids = entry.get("ids")
+        if not isinstance(ids, list) or len(self.repository.get_conversations(ids)) != len(set(ids)):
+            return None
+        return ids
+
+    def _record_file(self, path: Path, stat: os.stat_result, data: Any) -> None:
+        """Remember a parsed file's conversation IDs for later incremental runs."""
+        items = data if isinstance(data, list) else [data]
+        ids = [item.get("conversation_id") if isinstance(item, dict) else None for item in items]
+        if self._manifest is None:
+            self._manifest = self._read_manifest()
+        if all(isinstance(cid, str) for cid in ids):
+            self._manifest[str(path)] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "ids": ids}
+        else:
+            # IDs assigned at ingestion can't be matched up on a later run
+            self._manifest.pop(str(path), None)
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the incremental-run manifest, or start an empty one."""
         try:
-            result = self.ingestion_service.ingest_batch(conversations)
-            print(f"✅ Ingested: {result.get('total', 0)} total, {result.get('new', 0)} new")
-            return result
-        except Exception as e:
-            print(f"❌ Ingestion failed: {e}")
-            return {"error": str(e)}
+            manifest = json.loads(self._manifest_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable pipeline manifest {self._manifest_path}: {e!r}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self) -> None:
+        """Write the manifest atomically, so an interrupted run can't corrupt it."""
+        if self._manifest is None:
+            return
+        self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._manifest_path.with_name(f"{self._manifest_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self._manifest), encoding="utf-8")
+        os.replace(tmp, self._manifest_path)
+
+    def _load_and_ingest(
+        self,
+        source_pattern: str,
+        max_conversations: int | None = None,
+        chunk_size: int = 32,
+        incremental: bool = False,
+    ) -> tuple[List[Dict[str, Any]], IngestionResult | Dict[str, Any]]:
+        """Run loading on a background thread and ingest its output in chunks.
+
+        Parsed files flow through a bounded queue, so ingestion of early
+        files overlaps with reading later ones instead of waiting for the
+        whole load to finish.
+        """
+        feed: queue.Queue = queue.Queue(maxsize=64)
+        loaded: Dict[str, Any] = {}
+
+        def load() -> None:
+            try:
+                loaded["conversations"] = self._load_conversations(
+                    source_pattern, max_conversations, sink=feed.put, incremental=incremental
+                )
+            except BaseException as e:
+                loaded["error"] = e
+            finally:
+                feed.put(None)
+
+        loader = threading.Thread(target=load, name="batch-loader", daemon=True)
+        loader.start()
+
+        results: List[IngestionResult] = []
+        ingest_error: Exception | None = None
+        pending: List[Dict[str, Any]] = []
+        while True:
+            batch = feed.get()
+            if batch is not None:
+                pending.extend(batch)
+            if pending and (batch is None or len(pending) >= chunk_size):
+                if ingest_error is None:
+                    try:
+                        results.append(self.ingestion_service.ingest_batch(pending))
+                    except Exception as e:
+                        ingest_error = e
+                pending = []
+            if batch is None:
+                break
+        loader.join()
+        if "error" in loaded:
+            raise loaded["error"]
+
+        print("\n🔄 Stage 2: Ingesting Conversations")
+        if ingest_error is not None:
+            print(f"❌ Ingestion failed: {ingest_error}")
+            return loaded["conversations"], {"error": str(ingest_error)}
+        result = IngestionResult(
+            total=sum(r.total for r in results),
+            success=sum(r.success for r in results),
+            failed=sum(r.failed for r in results),
+            errors=[error for r in results for error in r.errors],
+            conversation_ids=[cid for r in results for cid in r.conversation_ids],
+        )
+        print(f"✅ Ingested: {result.total} total, {result.success} succeeded, {result.failed} failed")
+        return loaded["conversations"], result
 
     def _run_staged_evaluation(
         self,
@@ -216,11 +437,8 @@ class BatchPipelineProcessor:
                 print("   ⚠️ No conversations to evaluate in this stage")
                 continue
 
-            # Create fresh evaluation service for this stage (isolated from other stages)
-            registry = get_global_registry()
-            stage_eval_service = EvaluationService(
-                self.repository, registry, enabled_evaluators=evaluators
-            )
+            # Stage-specific evaluation service (isolated from other stages)
+            stage_eval_service = self._stage_service(evaluators)
 
             # Evaluate conversations with progress
             stage_evaluations = self._evaluate_conversations_with_progress(
@@ -231,6 +449,36 @@ class BatchPipelineProcessor:
 
         return all_evaluations
 
+    @staticmethod
+    def _active_schema_stamp() -> tuple[int, int] | None:
+        """Modification time and size of the active tool schema, if any."""
+        try:
+            stat = ACTIVE_SCHEMA_PATH.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _stage_service(self, evaluators: List[str]) -> EvaluationService:
+        """Return the evaluation service running exactly ``evaluators``.
+
+        Cached services rebuild their strategies once the active tool schema
+        has changed (e.g. after an approved schema proposal), since tool
+        evaluators read it when constructed.
+        """
+        stamp = self._active_schema_stamp()
+        if stamp != self._schema_stamp:
+            self._schema_stamp = stamp
+            for service in self._stage_services.values():
+                service.refresh_strategies()
+        key = tuple(evaluators)
+        service = self._stage_services.get(key)
+        if service is None:
+            service = EvaluationService(
+                self.repository, get_global_registry(), enabled_evaluators=list(key)
+            )
+            self._stage_services[key] = service
+        return service
+
     def _filter_conversations_for_stage(
         self,
         conversation_ids: List[str],
@@ -241,19 +489,9 @@ class BatchPipelineProcessor:
             return conversation_ids
 
         if filter_criteria == "has_issues":
-            # Get conversations that have issues from previous evaluations
-            prev_evaluations = self.repository.list_evaluations(limit=1000)
-
-            # Build lookup of conversation_id -> has_issues
-            issues_lookup = {}
-            for eval_result in prev_evaluations:
-                issues_lookup[eval_result.conversation_id] = len(eval_result.issues) > 0
-
-            # Filter to conversations with issues
-            filtered_ids = [
-                cid for cid in conversation_ids
-                if issues_lookup.get(cid, False)
-            ]
+            # Latest evaluation of each candidate, looked up in one repository call
+            with_issues = self.repository.get_ids_with_issues(conversation_ids)
+            filtered_ids = [cid for cid in conversation_ids if cid in with_issues]
 
             print(f"   🔍 Filtered to {len(filtered_ids)} conversations with issues")
             return filtered_ids
@@ -264,33 +502,56 @@ class BatchPipelineProcessor:
         self,
         eval_service: EvaluationService,
         conversation_ids: List[str],
-        stage_number: int
+        stage_number: int,
+        batch_size: int = 32,
     ) -> List[Any]:
-        """Evaluate conversations one by one with progress tracking."""
+        """Evaluate conversations in batches with progress tracking.
+
+        Each batch goes through ``evaluate_batch`` (one repository fetch and
+        save, strategies run concurrently). A batch that fails as a whole is
+        retried one conversation at a time so a single bad ID only loses itself.
+        """
         evaluations = []
+        issues_found = 0
+        total = len(conversation_ids)
 
-        print(f"   📊 Processing {len(conversation_ids)} conversations...")
+        print(f"   📊 Processing {total} conversations...")
 
-        for i, conv_id in enumerate(conversation_ids, 1):
+        # Row templates built once per stage; %-formatting beats per-row f-strings with format specs
+        row_fmt = "      %2d/" + str(total) + " %s %-28s Score: %.2f Issues: %d"
+        error_fmt = "      %2d/" + str(total) + " ❌ %-28s ERROR: %s"
+
+        for start in range(0, total, batch_size):
+            batch_ids = conversation_ids[start:start + batch_size]
             try:
-                # Evaluate single conversation
-                eval_result = eval_service.evaluate(conv_id)
+                outcomes = eval_service.evaluate_batch(batch_ids)
+            except Exception:
+                outcomes = []
+                for conv_id in batch_ids:
+                    try:
+                        outcomes.append(eval_service.evaluate(conv_id))
+                    except Exception as e:
+                        outcomes.append(e)
+
+            progress = []
+            for i, (conv_id, eval_result) in enumerate(zip(batch_ids, outcomes), start + 1):
+                if isinstance(eval_result, Exception):
+                    progress.append(error_fmt % (i, conv_id[:28], str(eval_result)[:40]))
+                    continue
                 evaluations.append(eval_result)
 
                 # Progress indicator
-                has_issues = len(eval_result.issues) > 0
-                status = "❌" if has_issues else "✅"
-                score = f"{eval_result.aggregate_score:.2f}"
                 issues_count = len(eval_result.issues)
+                if issues_count:
+                    issues_found += 1
+                status = "❌" if issues_count else "✅"
 
-                print(f"      {i:2d}/{len(conversation_ids)} {status} {conv_id[:28]:<28} Score: {score} Issues: {issues_count}")
+                progress.append(row_fmt % (i, status, conv_id[:28], eval_result.aggregate_score, issues_count))
 
-            except Exception as e:
-                print(f"      {i:2d}/{len(conversation_ids)} ❌ {conv_id[:28]:<28} ERROR: {str(e)[:40]}")
-                continue
+            # One write per batch rather than one per conversation
+            print("\n".join(progress))
 
         # Stage summary
-        issues_found = sum(1 for e in evaluations if len(e.issues) > 0)
         print(f"   ✅ Stage {stage_number} complete: {len(evaluations)} evaluated, {issues_found} with issues")
 
         return evaluations
@@ -311,25 +572,27 @@ class BatchPipelineProcessor:
     def _generate_summary(
         self,
         conversations: List[Dict[str, Any]],
-        evaluations: List[Any],
+        final_evaluations: List[Any],
         proposals: List[Any]
     ) -> Dict[str, Any]:
-        """Generate comprehensive summary of the batch analysis."""
-        print("\n📊 Batch Analysis Complete")
+        """Generate comprehensive summary of the batch analysis.
 
-        # Use deduplicated final evaluations for summary
-        final_evaluations = []
-        if evaluations:
-            eval_by_conv = {}
-            for eval_result in evaluations:
-                conv_id = eval_result.conversation_id
-                eval_by_conv[conv_id] = eval_result  # Later stages override
-            final_evaluations = list(eval_by_conv.values())
+        ``final_evaluations`` holds one (final-stage) evaluation per conversation.
+        """
+        print("\n📊 Batch Analysis Complete")
 
+        # One pass over the evaluations for all three aggregates
+        conversations_with_issues = 0
+        total_issues = 0
+        score_sum = 0.0
+        for e in final_evaluations:
+            issue_count = len(e.issues)
+            if issue_count:
+                conversations_with_issues += 1
+                total_issues += issue_count
+            score_sum += e.aggregate_score
         total_evaluations = len(final_evaluations)
-        conversations_with_issues = sum(1 for e in final_evaluations if len(e.issues) > 0)
-        total_issues = sum(len(e.issues) for e in final_evaluations)
-        avg_score = sum(e.aggregate_score for e in final_evaluations) / total_evaluations if total_evaluations > 0 else 0
+        avg_score = score_sum / total_evaluations if total_evaluations > 0 else 0
 
         summary = {
             "total_conversations": len(conversations),
@@ -338,7 +601,7 @@ class BatchPipelineProcessor:
             "total_issues": total_issues,
             "average_score": round(avg_score, 3),
             "proposals_count": len(proposals),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now().isoformat()
         }
 
         print(f"   Conversations: {summary['total_conversations']}")
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
-import shutil
+import os
 from typing import Any
 
+from src.config import get_settings
 from src.db.repository import ConversationRepository, get_repository
 from src.evaluation.evaluators import get_global_registry, EvaluatorDiscovery
 from src.evaluation.service import EvaluationService
-from src.ingestion.service import IngestionService, ValidationError
+from src.ingestion.service import IngestionService, ValidationError, _load_json_file, _move_file
 from src.analysis.service import AnalysisService
 from src.feedback.service import FeedbackService
-from src.models import FeedbackSignal
+from src.models import FeedbackSignal, parse_utc_timestamp, utc_now
 
 
 class PipelineProcessor:
@@ -40,7 +41,7 @@ class PipelineProcessor:
                 If None, uses all enabled evaluators from config.
         """
         self.repository = repository or get_repository(data_dir="./data")
-        self.source_dir = Path(source_dir)
+        self.source_dir = Path(source_dir).absolute()
         self.processed_dir = Path(processed_dir)
 
         registry = get_global_registry()
@@ -157,25 +158,17 @@ class PipelineProcessor:
     ):
         """Apply a proposal and run the real regression gate."""
         self.analysis_service.apply_proposal(proposal_id)
-        prompts = json.loads(Path(prompts_path).read_text())
+        prompts = _load_json_file(Path(prompts_path))
         return self.analysis_service.run_real_regression(proposal_id, prompts)
 
     def _parse_feedback(self, item: dict[str, Any]) -> FeedbackSignal:
         """Normalize feedback payloads into FeedbackSignal objects."""
-        timestamp = item.get("timestamp")
-        parsed = None
-        if isinstance(timestamp, str):
-            try:
-                parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            except ValueError:
-                parsed = None
-
         return FeedbackSignal(
             feedback_type=item.get("feedback_type", "explicit"),
             signal=item.get("signal", ""),
             value=item.get("value"),
             source=item.get("source", ""),
-            timestamp=parsed or datetime.utcnow(),
+            timestamp=parse_utc_timestamp(item.get("timestamp")) or utc_now(),
             turn_id=item.get("turn_id"),
             annotator_id=item.get("annotator_id"),
             confidence=item.get("confidence"),
@@ -188,9 +181,24 @@ class PipelineProcessor:
         files: list[Path] = []
 
         self.source_dir.mkdir(parents=True, exist_ok=True)
-        for path in self.source_dir.glob("*.json"):
+        # scandir + a suffix check; Paths are only built for matching files
+        with os.scandir(self.source_dir) as entries:
+            paths = [
+                self.source_dir / entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        if not paths:
+            return conversations, files
+
+        # Read and parse files concurrently, then merge in glob order
+        workers = min(len(paths), get_settings().max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_load_json_file, path) for path in paths]
+
+        for path, future in zip(paths, futures):
             try:
-                data = json.loads(path.read_text())
+                data = future.result()
             except json.JSONDecodeError:
                 continue
 
@@ -210,5 +218,4 @@ class PipelineProcessor:
         """Move ingested files to processed_dir."""
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         for path in files:
-            target = self.processed_dir / path.name
-            shutil.move(str(path), str(target))
+            _move_file(path, self.processed_dir / path.name)
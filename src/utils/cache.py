@@ -0,0 +1,196 @@
+"""Small key/value caches for expensive results (e.g. LLM responses)."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+
+def content_key(*parts: str) -> str:
+    """Hash parts into a cache key.
+
+    Each part is length-prefixed (8 bytes, big-endian) before hashing, so
+    different splits of the same text can never collide.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class CacheInterface(ABC):
+    """Abstract string cache keyed by hex digests."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the cached value, or None on a miss."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a value."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Evict a value if present."""
+        pass
+
+
+class MemoryCacheBackend(CacheInterface):
+    """Bounded in-process LRU cache; the least recently used key is evicted first."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class DiskCacheBackend(CacheInterface):
+    """Content-addressable cache storing one file per key under a directory.
+
+    Files are fanned out by the first two hex characters of the key and
+    written atomically, so concurrent readers never see partial values.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Unique per thread, so concurrent writers of one key never share a tmp file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(value, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class SemanticCache:
+    """Nearest-neighbour cache over embedding vectors.
+
+    Lookups return the payload of the most similar stored vector when its
+    cosine similarity reaches ``threshold``. Vectors are kept L2-normalized
+    in one NumPy matrix, grown by doubling so inserts are amortized O(1),
+    and a lookup is a single matrix-vector product (exact inner-product
+    search). With ``cache_dir`` set, entries are appended to
+    ``semantic.jsonl`` there and reloaded on construction.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, threshold: float = 0.97):
+        self.threshold = threshold
+        # Rows [0, _size) of _buffer hold the stored vectors
+        self._buffer: np.ndarray | None = None
+        self._size = 0
+        self._payloads: list[str] = []
+        self._lock = threading.Lock()
+        self._path = None
+        if cache_dir:
+            self._path = Path(cache_dir) / "semantic.jsonl"
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        entries = []
+        with self._path.open("r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                    vector, payload = self._normalize(entry["vector"]), entry["payload"]
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    print(f"Warning: Skipping bad semantic cache line {line_no} of {self._path}: {e!r}")
+                    continue
+                if vector.ndim == 1 and vector.size:
+                    entries.append((vector, payload))
+        if not entries:
+            return
+        # Vectors from an earlier embedding model can't be compared with the
+        # current ones; keep only those matching the newest entry's dimension.
+        dim = entries[-1][0].size
+        kept = [(v, p) for v, p in entries if v.size == dim]
+        if len(kept) < len(entries):
+            print(f"Warning: Skipping {len(entries) - len(kept)} semantic cache entries of {self._path} "
+                  f"whose dimension differs from {dim}")
+        self._buffer = np.vstack([v for v, _ in kept])
+        self._size = len(kept)
+        self._payloads = [p for _, p in kept]
+
+    def lookup(self, vector: Sequence[float]) -> str | None:
+        """Return the payload of the nearest entry if it is similar enough."""
+        v = self._normalize(vector)
+        with self._lock:
+            if not self._size or v.shape != self._buffer.shape[1:]:
+                return None
+            sims = self._buffer[:self._size] @ v
+            best = int(np.argmax(sims))
+            if sims[best] >= self.threshold:
+                return self._payloads[best]
+        return None
+
+    def add(self, vector: Sequence[float], payload: str) -> None:
+        """Insert an entry (and append it to the backing file, if any)."""
+        v = self._normalize(vector)
+        with self._lock:
+            if self._buffer is None:
+                self._buffer = np.empty((16, v.size), dtype=np.float32)
+            elif v.shape != self._buffer.shape[1:]:
+                raise ValueError(
+                    f"Embedding dimension {v.size} doesn't match the cache's {self._buffer.shape[1]}"
+                )
+            elif self._size == len(self._buffer):
+                grown = np.empty((2 * len(self._buffer), v.size), dtype=np.float32)
+                grown[:self._size] = self._buffer[:self._size]
+                self._buffer = grown
+            self._buffer[self._size] = v
+            self._size += 1
+            self._payloads.append(payload)
+            if self._path is not None:
+                with self._path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps({"vector": v.tolist(), "payload": payload}) + "\n")
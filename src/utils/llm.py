@@ -1,13 +1,37 @@
 from __future__ import annotations
+import importlib.util
 import os
 from enum import Enum
-from openai import OpenAI
+from functools import lru_cache
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from src.config import get_settings
 
+# Connection pool for the shared clients: enough keep-alive connections for
+# concurrent judge calls, so they rarely pay a fresh TCP/TLS handshake.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# HTTP/2 lets concurrent requests share one connection; httpx needs the
+# optional h2 package for it.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 class LLMModel(Enum):
     """Supported LLM models."""
     OPENAI_GPT_4_O = "gpt-4o"
 
+@lru_cache(maxsize=None)
+def _shared_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for an API key.
+    
+    Evaluators (and their factories) are created per conversation; sharing
+    the client keeps its connection pool, and so TCP/TLS sessions, alive
+    across them. The sync client is safe to use from multiple threads.
+    """
+    # Fix for 'proxies' argument mismatch in some environment versions
+    # We manually instantiate the http client to avoid the library's default behavior that might be passing unsupported args
+    return OpenAI(api_key=api_key, http_client=httpx.Client(http2=_HTTP2, limits=_HTTP_LIMITS))
+
+
 class LLMClientFactory:
     """Simplified LLM client factory focusing on standard OpenAI."""
     
@@ -16,12 +40,10 @@ class LLMClientFactory:
         # Use effective_openai_key which checks both openai_key and openai_api_key
         api_key = settings.effective_openai_key or os.getenv("OPENAI_KEY") or os.getenv("OPENAI_API_KEY")
         
+        self.api_key = api_key
         if api_key:
-            # Fix for 'proxies' argument mismatch in some environment versions
-            # We manually instantiate the http client to avoid the library's default behavior that might be passing unsupported args
-            import httpx
-            http_client = httpx.Client()
-            self.client = OpenAI(api_key=api_key, http_client=http_client)
+            # Shared per key, so every factory reuses one keep-alive pool
+            self.client = _shared_client(api_key)
         else:
             # Start: Critical Error as requested by user
             # We should fail if no key is provided in a production-like/assignment environment
@@ -30,3 +52,14 @@ class LLMClientFactory:
     def get_client(self):
         """Return the standard OpenAI client (or None if in mock mode)."""
         return self.client
+
+    def create_async_client(self) -> AsyncOpenAI:
+        """Create a new async OpenAI client.
+        
+        Async HTTP clients are bound to the event loop they're used on, so
+        each caller owns the returned client and should ``await close()`` it.
+        """
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(http2=_HTTP2, limits=_HTTP_LIMITS),
+        )